@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """Test that deck saving works correctly during preparation."""
 
+import io
 import json
-import os
 from tradeoff_rpg import Player, Card, CardType, CardClass, WeaponType, AccessoryType, save_game
 
 def test_deck_save():
@@ -26,19 +26,15 @@ def test_deck_save():
     ]
 
     # This simulates what happens in prep_menu when saving:
-    # The cards are collected but not yet equipped
-    old_deck = player.deck.copy() if player.deck else []
-    player.deck = test_cards
+    # The cards are collected but not yet equipped, so they are passed as an override
+    buffer = io.BytesIO()
+    save_game([player], buffer, deck_overrides={player: test_cards})
 
-    # Save the game
-    save_game([player], "test_save.json")
-
-    # Restore the deck state (as the fix does)
-    player.deck = old_deck
+    # The player's own deck is left untouched
+    assert player.deck == [], f"Expected deck to be untouched, got {player.deck}"
 
     # Now verify the save file contains the cards
-    with open("test_save.json", 'r') as f:
-        save_data = json.load(f)
+    save_data = json.loads(buffer.getvalue())
 
     saved_deck = save_data['players'][0]['deck']
 
@@ -54,9 +50,6 @@ def test_deck_save():
     actual_names = [card['name'] for card in saved_deck]
     assert actual_names == expected_names, f"Card names don't match: {actual_names}"
 
-    # Clean up
-    os.remove("test_save.json")
-
     print("\n✓ Test passed! Deck saves correctly during preparation.")
 
 if __name__ == "__main__":
@@ -91,6 +91,29 @@ def test_vampirism_card():
     assert player.defense == -4, f"Expected defense=-4, got {player.defense}"
     print("✓ Vampirism 3 card works (+9 health regen, -9 defense)")
 
+def test_add_cards_stacks_bonuses():
+    """Test that adding several cards at once stacks their bonuses."""
+    player = Player("Test Hero")
+
+    regen_card = Card(
+        "Regeneration 1", CardType.PASSIVE, CardClass.STAT,
+        "+2 Health Regen",
+        health_regen_bonus=2
+    )
+    resilience_card = Card(
+        "Resilience 2", CardType.PASSIVE, CardClass.STAT,
+        "+30 HP, +2 Health Regen",
+        hp_bonus=30,
+        health_regen_bonus=2
+    )
+
+    player.add_cards([regen_card, resilience_card])
+
+    assert len(player.deck) == 2, f"Expected 2 cards in deck, got {len(player.deck)}"
+    assert player.max_hp == 130, f"Expected max_hp=130, got {player.max_hp}"
+    assert player.health_regen == 9, f"Expected health_regen=9, got {player.health_regen}"
+    print("✓ Adding cards in one batch stacks bonuses (+30 HP, +4 health regen)")
+
 def test_card_serialization():
     """Test that health_regen_bonus is serialized correctly."""
     from tradeoff_rpg import card_to_dict, dict_to_card
@@ -120,6 +143,7 @@ if __name__ == "__main__":
         test_regeneration_card()
         test_resilience_card()
         test_vampirism_card()
+        test_add_cards_stacks_bonuses()
         test_card_serialization()
         print("\n✅ All tests passed!")
     except AssertionError as e:
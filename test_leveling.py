@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Test player XP requirements and floor XP rewards."""
+
+from tradeoff_rpg import Player
+
+def test_xp_for_next_level():
+    """Test that level XP requirements follow the formula, including past level 20."""
+    player = Player("Test Hero")
+    for level in (0, 1, 9, 10, 20, 21, 35):
+        player.level = level
+        expected = level * level * 1000 + (level // 10 * 10000)
+        actual = player.get_xp_for_next_level()
+        assert actual == expected, f"Level {level}: expected {expected} XP, got {actual}"
+    print("✓ XP for next level matches the formula (levels 0-35)")
+
+def test_xp_from_floor():
+    """Test that floor XP follows the formula, including past floor 1000."""
+    player = Player("Test Hero")
+    for floor in (1, 2, 3, 500, 1000, 1001):
+        expected = int(100 * (1.1 ** (floor - 1)))
+        actual = player.get_xp_from_floor(floor)
+        assert actual == expected, f"Floor {floor}: expected {expected} XP, got {actual}"
+    print("✓ XP from floor matches the formula (floors 1-1001)")
+
+if __name__ == "__main__":
+    test_xp_for_next_level()
+    test_xp_from_floor()
+    print("\n✅ All tests passed!")
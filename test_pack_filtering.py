@@ -3,7 +3,7 @@
 
 from tradeoff_rpg import (
     Card, CardType, CardClass, WeaponType,
-    create_card_packs, open_pack, get_compatible_weapon_types
+    create_card_packs, open_pack_batch, get_compatible_weapon_types
 )
 
 def test_quiver_filtering():
@@ -18,11 +18,8 @@ def test_quiver_filtering():
     # compatible_types = None (no weapons equipped)
     # is_weapon_pack = True
 
-    draws = []
-    for _ in range(100):
-        card = open_pack(packs["Physical Weapons"], player=None, compatible_weapon_types=None, is_weapon_pack=True)
-        if card and card.card_type == CardType.WEAPON:
-            draws.append(card.weapon_type)
+    cards = open_pack_batch(packs["Physical Weapons"], 100, player=None, compatible_weapon_types=None, is_weapon_pack=True)
+    draws = [card.weapon_type for card in cards if card.card_type == CardType.WEAPON]
 
     quiver_count = sum(1 for wt in draws if wt == WeaponType.QUIVER)
     print(f"Drew {len(draws)} weapons from Physical Weapons pack")
@@ -52,11 +49,8 @@ def test_bow_quiver_filtering():
     print(f"Compatible types with bow: {[wt.value for wt in compatible_types]}")
 
     # Draw from Physical Weapons pack
-    draws = []
-    for _ in range(100):
-        card = open_pack(packs["Physical Weapons"], player=None, compatible_weapon_types=compatible_types, is_weapon_pack=True)
-        if card and card.card_type == CardType.WEAPON:
-            draws.append(card.weapon_type)
+    cards = open_pack_batch(packs["Physical Weapons"], 100, player=None, compatible_weapon_types=compatible_types, is_weapon_pack=True)
+    draws = [card.weapon_type for card in cards if card.card_type == CardType.WEAPON]
 
     quiver_count = sum(1 for wt in draws if wt == WeaponType.QUIVER)
     print(f"Drew {len(draws)} weapons from Physical Weapons pack")
@@ -86,11 +80,8 @@ def test_sword_filtering():
     print(f"Compatible types with sword: {[wt.value for wt in compatible_types]}")
 
     # Draw from Physical Weapons pack
-    draws = []
-    for _ in range(50):
-        card = open_pack(packs["Physical Weapons"], player=None, compatible_weapon_types=compatible_types, is_weapon_pack=True)
-        if card and card.card_type == CardType.WEAPON:
-            draws.append(card.weapon_type)
+    cards = open_pack_batch(packs["Physical Weapons"], 50, player=None, compatible_weapon_types=compatible_types, is_weapon_pack=True)
+    draws = [card.weapon_type for card in cards if card.card_type == CardType.WEAPON]
 
     invalid_draws = [wt for wt in draws if wt not in compatible_types]
     print(f"Drew {len(draws)} weapons from Physical Weapons pack")
@@ -3,11 +3,14 @@
 Test script for save/load functionality
 """
 
+import io
 import sys
-import os
 
 # Import from the main game file
-from tradeoff_rpg import Player, Card, CardType, CardClass, save_game, load_game
+from tradeoff_rpg import (
+    Player, Card, CardType, CardClass, save_game, load_game,
+    save_game_binary, load_game_binary
+)
 
 def test_save_load():
     """Test that save and load functions work correctly."""
@@ -45,17 +48,19 @@ def test_save_load():
 
     player1.deck = [card1, card2]
 
-    # Save the player
+    # Save the player to an in-memory buffer
     print("\n1. Saving player...")
-    save_game(player1, "test_save.json")
+    buffer = io.BytesIO()
+    save_game([player1], buffer)
 
-    # Load the player
+    # Load the player back from the same bytes
     print("\n2. Loading player...")
-    player2 = load_game("test_save.json")
+    loaded = load_game(io.BytesIO(buffer.getvalue()))
 
     # Verify the loaded player matches
     print("\n3. Verifying loaded data...")
-    assert player2 is not None, "Failed to load player"
+    assert loaded is not None, "Failed to load player"
+    player2 = loaded[0]
     assert player2.name == player1.name, f"Name mismatch: {player2.name} != {player1.name}"
     assert player2.level == player1.level, f"Level mismatch: {player2.level} != {player1.level}"
     assert player2.current_xp == player1.current_xp, f"XP mismatch: {player2.current_xp} != {player1.current_xp}"
@@ -72,9 +77,147 @@ def test_save_load():
 
     print("\n✅ All tests passed!")
 
-    # Cleanup
-    os.remove("test_save.json")
-    print("   Test file cleaned up.")
+def test_binary_save_load():
+    """Test that the binary save format round-trips player data."""
+    print("Testing binary save/load functionality...")
+
+    from tradeoff_rpg import WeaponType
+
+    player1 = Player("BinaryHero")
+    player1.level = 7
+    player1.bounty = 250
+    player1.ascension_slots = ["Impaler"]
+    player1.deck = [
+        Card("Test Bow", CardType.WEAPON, CardClass.EQUIPMENT, "A test bow",
+             attack_bonus=20, damage=20, weapon_type=WeaponType.BOW)
+    ]
+
+    buffer = io.BytesIO()
+    save_game_binary([player1], buffer)
+    loaded = load_game_binary(io.BytesIO(buffer.getvalue()))
+
+    assert loaded is not None, "Failed to load binary save"
+    player2 = loaded[0]
+    assert player2.name == player1.name, f"Name mismatch: {player2.name} != {player1.name}"
+    assert player2.level == player1.level, f"Level mismatch: {player2.level} != {player1.level}"
+    assert player2.bounty == player1.bounty, f"Bounty mismatch: {player2.bounty} != {player1.bounty}"
+    assert player2.ascension_slots == player1.ascension_slots, f"Ascension slots mismatch: {player2.ascension_slots}"
+    assert player2.deck[0].name == "Test Bow", f"Card name mismatch: {player2.deck[0].name}"
+    assert player2.deck[0].weapon_type == WeaponType.BOW, f"Weapon type mismatch: {player2.deck[0].weapon_type}"
+
+    print("\n✅ Binary save/load works!")
+
+def test_load_interns_identical_cards():
+    """Test that identical saved cards load as one shared Card, and different ones stay apart."""
+    print("Testing card interning on load...")
+
+    from tradeoff_rpg import WeaponType
+
+    def make_sword(attack=30, description="A sword"):
+        return Card("Iron Sword", CardType.WEAPON, CardClass.EQUIPMENT, description,
+                    attack_bonus=attack, damage=attack, weapon_type=WeaponType.SWORD)
+
+    sword = make_sword()
+    player1 = Player("Collector")
+    # Same object twice, an equal copy, then two swords that differ in one field each
+    player1.deck = [sword, sword, make_sword(), make_sword(attack=31), make_sword(description="A sharper sword")]
+    player2 = Player("Rival")
+    player2.deck = [make_sword()]
+
+    buffer = io.BytesIO()
+    save_game([player1, player2], buffer)
+    loaded = load_game(io.BytesIO(buffer.getvalue()))
+
+    assert loaded is not None, "Failed to load player"
+    deck = loaded[0].deck
+    assert deck[0] is deck[1], "Duplicate saved cards were not interned"
+    assert deck[0] is deck[2], "Equal saved cards were not interned"
+    assert loaded[1].deck[0] is deck[0], "Equal cards were not shared across players"
+    assert deck[3] is not deck[0], "Cards with different attack were merged"
+    assert deck[3].attack_bonus == 31, f"Card attack mismatch: {deck[3].attack_bonus}"
+    assert deck[4] is not deck[0], "Cards with different descriptions were merged"
+    assert deck[4].description == "A sharper sword", f"Card description mismatch: {deck[4].description}"
+
+    print("\n✅ Identical cards are shared, distinct cards stay separate!")
+
+def test_save_compact_by_default():
+    """Test that saves are compact by default, indented with pretty=True, and load the same either way."""
+    print("Testing compact and pretty JSON saves...")
+
+    import json
+    import tradeoff_rpg
+
+    player = Player("Formatter")
+    player.bounty = 42
+    player.deck = [Card("Test Armor", CardType.ARMOR, CardClass.EQUIPMENT, "Test armor",
+                        defense_bonus=30, hp_bonus=100)]
+
+    # Exercise orjson (when installed) and the stdlib json fallback
+    backends = [("json", None)]
+    if tradeoff_rpg.orjson is not None:
+        backends.insert(0, ("orjson", tradeoff_rpg.orjson))
+    saved_orjson = tradeoff_rpg.orjson
+    try:
+        for backend_name, backend in backends:
+            tradeoff_rpg.orjson = backend
+
+            compact = io.BytesIO()
+            save_game([player], compact)
+            pretty = io.BytesIO()
+            save_game([player], pretty, pretty=True)
+
+            assert b"\n" not in compact.getvalue(), f"{backend_name}: default save is not compact"
+            assert b'\n  "' in pretty.getvalue(), f"{backend_name}: pretty save is not indented"
+            assert json.loads(compact.getvalue()) == json.loads(pretty.getvalue()), \
+                f"{backend_name}: compact and pretty saves hold different data"
+
+            for raw in (compact.getvalue(), pretty.getvalue()):
+                loaded = load_game(io.BytesIO(raw))
+                assert loaded is not None, f"{backend_name}: failed to load save"
+                assert loaded[0].name == "Formatter", f"{backend_name}: name mismatch: {loaded[0].name}"
+                assert loaded[0].bounty == 42, f"{backend_name}: bounty mismatch: {loaded[0].bounty}"
+                assert loaded[0].deck[0].defense_bonus == 30, \
+                    f"{backend_name}: card defense mismatch: {loaded[0].deck[0].defense_bonus}"
+            print(f"✓ {backend_name}: compact by default, indented with pretty=True")
+    finally:
+        tradeoff_rpg.orjson = saved_orjson
+
+    print("\n✅ Save formatting works!")
+
+class _RunsCode:
+    """Pickles to a call of a builtin, like a tampered save file would."""
+
+    def __reduce__(self):
+        return (print, ("this should never run",))
+
+def test_binary_load_refuses_objects():
+    """Test that binary saves referencing classes or globals are refused, not loaded."""
+    print("Testing binary load refuses code references...")
+
+    import os
+    import pickle
+
+    tampered = [
+        # A bare global reference
+        pickle.dumps({'num_players': 0, 'players': [], 'extra': os.getcwd}, protocol=5),
+        # A class instance
+        pickle.dumps({'num_players': 1, 'players': [Player("Pickled")]}, protocol=5),
+        # A reduce payload that would call a builtin
+        pickle.dumps({'num_players': 0, 'players': [], 'extra': _RunsCode()}, protocol=5),
+    ]
+    for raw in tampered:
+        loaded = load_game_binary(io.BytesIO(raw))
+        assert loaded is None, f"Tampered binary save was loaded: {loaded}"
+
+    # Plain containers and scalars still load
+    plain = pickle.dumps({'num_players': 0, 'players': []}, protocol=5)
+    assert load_game_binary(io.BytesIO(plain)) == [], "Plain binary save failed to load"
+
+    print("\n✅ Binary load refuses classes and globals!")
 
 if __name__ == "__main__":
     test_save_load()
+    test_binary_save_load()
+    test_load_interns_identical_cards()
+    test_save_compact_by_default()
+    test_binary_load_refuses_objects()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Test the batch tower simulation helpers."""
+
+from tradeoff_rpg import (
+    Card, CardType, CardClass, WeaponType, Enemy,
+    simulate_climb, simulate_runs
+)
+
+def make_sword_deck():
+    """Build a small melee deck for simulation."""
+    return [
+        Card("Sword", CardType.WEAPON, CardClass.EQUIPMENT, "A sword",
+             attack_bonus=20, damage=20, weapon_type=WeaponType.SWORD),
+        Card("Chainmail", CardType.ARMOR, CardClass.EQUIPMENT, "Armor",
+             defense_bonus=10, hp_bonus=50),
+    ]
+
+def test_simulate_climb():
+    """Test that a single simulated climb reports a floor within range."""
+    floor = simulate_climb(make_sword_deck(), max_floor=20)
+    assert 1 <= floor <= 20, f"Expected floor between 1 and 20, got {floor}"
+    print(f"✓ Simulated climb reached floor {floor}")
+
+def test_simulate_runs():
+    """Test that parallel runs return one result per run."""
+    floors = simulate_runs(make_sword_deck(), runs=6, max_floor=20, workers=2)
+    assert len(floors) == 6, f"Expected 6 results, got {len(floors)}"
+    assert all(1 <= floor <= 20 for floor in floors), f"Floors out of range: {floors}"
+    print(f"✓ Parallel runs reached floors {floors}")
+
+def test_simulate_runs_seeded():
+    """Test that seeded runs are reproducible regardless of worker count."""
+    deck = make_sword_deck()
+    pooled = simulate_runs(deck, runs=8, max_floor=30, workers=2, seed=1234)
+    in_process = simulate_runs(deck, runs=8, max_floor=30, workers=1, seed=1234)
+    assert pooled == in_process, f"Seeded runs differ: {pooled} != {in_process}"
+    # A single run skips the pool too, and gets the same first seed
+    single = simulate_runs(deck, runs=1, max_floor=30, workers=2, seed=1234)
+    assert single == pooled[:1], f"Single seeded run differs: {single} != {pooled[:1]}"
+    print(f"✓ Seeded runs repeat: {pooled}")
+
+def test_spawn():
+    """Test that spawning picks a random type and reuses cached scaled stats."""
+    import random
+    from tradeoff_rpg import Tower
+
+    stats_cache = {}
+    enemy = Enemy.spawn(300, stats_cache)
+    assert enemy.floor == 300, f"Expected floor 300, got {enemy.floor}"
+    assert stats_cache == {(300, enemy.enemy_type): Enemy.scaled_stats(300, enemy.enemy_type)}, \
+        f"Unexpected stats cache: {stats_cache}"
+    uncached = Enemy.spawn(300)
+    expected = Enemy(300, uncached.enemy_type)
+    assert uncached.max_hp == expected.max_hp, f"{uncached.name}: HP {uncached.max_hp} != {expected.max_hp}"
+
+    # Tower.generate_enemy goes through spawn, so the same seed gives the same enemy
+    random.seed(7)
+    spawned = Enemy.spawn(42)
+    random.seed(7)
+    generated = Tower().generate_enemy(42)
+    assert generated.enemy_type == spawned.enemy_type, \
+        f"Tower picked {generated.enemy_type}, spawn picked {spawned.enemy_type}"
+    print(f"✓ Spawned {enemy.name} and {generated.name}")
+
+def test_spawn_batch():
+    """Test that batch spawning creates one enemy per floor and shares scaled stats."""
+    stats_cache = {}
+    floors = [1, 1, 250, 250, 999]
+    enemies = Enemy.spawn_batch(floors, stats_cache)
+    assert [enemy.floor for enemy in enemies] == floors, f"Floors don't match: {[e.floor for e in enemies]}"
+    for enemy in enemies:
+        expected = Enemy(enemy.floor, enemy.enemy_type)
+        assert enemy.max_hp == expected.max_hp, f"{enemy.name}: HP {enemy.max_hp} != {expected.max_hp}"
+        assert enemy.attack == expected.attack, f"{enemy.name}: attack {enemy.attack} != {expected.attack}"
+        assert (enemy.floor, enemy.enemy_type) in stats_cache, f"{enemy.name} stats not cached"
+    print(f"✓ Spawned batch: {[enemy.name for enemy in enemies]}")
+
+if __name__ == "__main__":
+    test_simulate_climb()
+    test_simulate_runs()
+    test_simulate_runs_seeded()
+    test_spawn()
+    test_spawn_batch()
+    print("\n✅ All tests passed!")
@@ -154,6 +154,38 @@ def test_mixed_weapons():
         print(f"✗ FAIL: {e}\n")
         return False
 
+def test_validate_deck_reports_errors():
+    """Test that validate_deck reports problems without raising or equipping."""
+    print("Test 9: validate_deck reports errors without raising (should pass)")
+    player = Player("Test Player")
+    valid_cards = [
+        Card("Sword 1", CardType.WEAPON, CardClass.EQUIPMENT, "Sword",
+             attack_bonus=50, weapon_type=WeaponType.SWORD),
+        Card("Sword 2", CardType.WEAPON, CardClass.EQUIPMENT, "Sword",
+             attack_bonus=50, weapon_type=WeaponType.SWORD),
+    ]
+    invalid_cards = [
+        Card("Staff 1", CardType.WEAPON, CardClass.EQUIPMENT, "Staff",
+             magic_attack_bonus=60, weapon_type=WeaponType.STAFF),
+        Card("Staff 2", CardType.WEAPON, CardClass.EQUIPMENT, "Staff",
+             magic_attack_bonus=60, weapon_type=WeaponType.STAFF),
+    ]
+
+    valid_errors = player.validate_deck(valid_cards)
+    invalid_errors = player.validate_deck(invalid_cards)
+
+    if valid_errors:
+        print(f"✗ FAIL: Valid deck reported errors: {valid_errors}\n")
+        return False
+    if not invalid_errors:
+        print("✗ FAIL: Dual wielding staffs should have been reported\n")
+        return False
+    if player.active_cards:
+        print("✗ FAIL: validate_deck should not equip any cards\n")
+        return False
+    print(f"✓ PASS: validate_deck reported: {invalid_errors[0]}\n")
+    return True
+
 def main():
     """Run all tests."""
     print("="*60)
@@ -170,6 +202,7 @@ def main():
         test_dual_wield_daggers,
         test_triple_swords,
         test_mixed_weapons,
+        test_validate_deck_reports_errors,
     ]
 
     results = [test() for test in tests]
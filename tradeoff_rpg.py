@@ -3,10 +3,53 @@ Tower Climbing Roguelike
 A competitive game where up to 4 players climb a 1000-floor tower using card-based builds.
 """
 
+import concurrent.futures
+import functools
+import io
+import itertools
+import operator
+import os
+import pickle
 import random
 import json
+from collections import Counter, deque
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import BinaryIO, Deque, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson  # Optional: much faster save/load when installed
+except ImportError:
+    orjson = None
+
+# Buffer size used when reading/writing save files
+SAVE_IO_BUFFER = 65536
+
+
+# Bound once: skips the module attribute lookup on every roll. This is the
+# shared global generator, so random.seed() still controls it.
+_random = random.random
+
+
+def _roll_percent() -> int:
+    """Roll a uniform 1-100 for percentage checks (faster than random.randint)."""
+    return int(_random() * 100) + 1
+
+
+def _percent_roll_hits(chance: float) -> float:
+    """Probability that a _roll_percent() roll is <= chance."""
+    return min(100, max(0, int(chance))) / 100
+
+
+def _roll_percent_pair() -> Tuple[int, int]:
+    """Roll two independent 1-100 values from a single random draw."""
+    roll = int(_random() * 10000)
+    return roll // 100 + 1, roll % 100 + 1
+
+
+# Separator lines used by the console output
+_SEP = "=" * 60
+_WIDE_SEP = "=" * 80
+_THIN_SEP = "-" * 60
 
 
 class CardType(Enum):
@@ -42,6 +85,15 @@ class WeaponType(Enum):
     BOW = "bow"  # Cannot dual wield (unless special card)
 
 
+# Weapons that count as magic weapons (let the player cast spells)
+_MAGIC_WEAPON_TYPES = (WeaponType.WAND, WeaponType.STAFF, WeaponType.TOME)
+
+# Weapons that can always be dual wielded, and those that need Titan's Strength
+# (tuples: membership tests on enum members hit the identity check, no hashing)
+_FREE_DUAL_WIELD_TYPES = (WeaponType.SWORD, WeaponType.WAND, WeaponType.SHIELD, WeaponType.QUIVER)
+_TITAN_DUAL_WIELD_TYPES = (WeaponType.GREATSWORD, WeaponType.AXE, WeaponType.SPEAR)
+
+
 class AccessoryType(Enum):
     """Types of accessories with equip limits."""
     RING = "ring"  # Can equip up to 2
@@ -52,6 +104,17 @@ class Card:
     """
     Cards are the core mechanic - they provide everything from weapons to stats.
     """
+    __slots__ = (
+        'name', 'card_type', 'card_class', 'description',
+        'weapon_type', 'accessory_type', 'spawn_condition',
+        'hp_bonus', 'attack_bonus', 'defense_bonus', 'magic_attack_bonus',
+        'mana_bonus', 'mana_regen_bonus', 'health_regen_bonus',
+        'crit_chance_bonus', 'crit_damage_bonus', 'dodge_chance_bonus',
+        'attack_speed_bonus', 'luck_bonus',
+        'special_effect', 'damage', 'magic_damage', 'mana_cost',
+        '_str',
+    )
+
     def __init__(self, name: str, card_type: CardType, card_class: CardClass, description: str,
                  hp_bonus: int = 0, attack_bonus: int = 0, defense_bonus: int = 0,
                  magic_attack_bonus: int = 0, mana_bonus: int = 0, mana_regen_bonus: int = 0,
@@ -91,35 +154,114 @@ class Card:
         self.magic_damage = magic_damage  # For spell cards
         self.mana_cost = mana_cost  # For spell cards
 
+        # Name, type and description never change, so the display string is cached
+        self._str = None
+
     def __str__(self):
-        return f"{self.name} ({self.card_type.value}): {self.description}"
+        if self._str is None:
+            self._str = f"{self.name} ({self.card_type.value}): {self.description}"
+        return self._str
+
+
+# Stat bonus fields on Card, in the order Player totals them
+BONUS_FIELDS = (
+    'hp_bonus', 'attack_bonus', 'defense_bonus', 'magic_attack_bonus',
+    'mana_bonus', 'mana_regen_bonus', 'health_regen_bonus',
+    'crit_chance_bonus', 'crit_damage_bonus', 'dodge_chance_bonus',
+    'attack_speed_bonus', 'luck_bonus',
+)
+_get_bonuses = operator.attrgetter(*BONUS_FIELDS)
+_get_damage = operator.attrgetter('damage')
+
+
+def _sum_card_bonuses(cards) -> List:
+    """Total every BONUS_FIELDS stat over the given cards, in BONUS_FIELDS order."""
+    bonus_rows = [_get_bonuses(card) for card in cards]
+    if not bonus_rows:
+        return [0] * len(BONUS_FIELDS)
+    return [sum(column) for column in zip(*bonus_rows)]
+
+
+# XP required to go from each level (0-20) to the next
+# Formula: level*level*1000 + (level//10*10000)
+_XP_FOR_NEXT_LEVEL = tuple(level * level * 1000 + (level // 10 * 10000) for level in range(21))
+
+# XP gained for clearing each floor of the tower (0-1000), see Player.get_xp_from_floor
+_XP_FROM_FLOOR = tuple(int(100 * (1.1 ** (floor - 1))) for floor in range(1001))
+
+# Player flag set by each unique card's special effect (see _apply_card_bonuses)
+_UNIQUE_EFFECT_FLAGS = {
+    "unparalleled_swiftness": "has_unparalleled_swiftness",
+    "reactive_armor": "has_reactive_armor",
+    "lucky_7": "has_lucky_7",
+    "mana_amplifier": "has_mana_amplifier",
+    "mana_conduit": "has_mana_conduit",
+    "titans_strength": "has_titans_strength",
+    "arcane_tome_wielder": "has_arcane_tome_wielder",
+    "berserkers_rage": "has_berserkers_rage",
+    "barrier": "has_barrier",
+    "unending_rage": "has_unending_rage",
+    "barrier_permanence": "has_barrier_permanence",
+    "dual_cast": "has_dual_cast",
+    "quick_meteor": "has_quick_meteor",
+    "spellblade": "has_spellblade",
+    "impaler_weapon": "has_impaler_weapon",
+    "arcane_battery": "has_arcane_battery",
+    "ogres_sword": "has_ogres_sword",
+}
 
 
 class Player:
     """
     Player class for tower climbers.
     """
+    # Lets combat tell players from enemies without probing attributes
+    IS_PLAYER = True
+
+    # Base stats (will be modified by cards). These never change, so they live on
+    # the class instead of being written into every instance.
+    base_hp = 100
+    base_attack = 10
+    base_defense = 5
+    base_magic_attack = 0
+    base_mana = 50
+    base_mana_regen = 10
+    base_health_regen = 5
+    base_crit_chance = 5.0  # Percentage
+    base_crit_damage = 1.5  # Multiplier (1.5 = 150% damage)
+    base_dodge_chance = 5.0  # Percentage
+    base_attack_speed = 1.0  # Attacks per turn
+    base_luck = 0  # Bonus luck stat
+
+    __slots__ = (
+        'name', 'current_floor', 'is_alive', 'escaped_floor', 'max_hp', 'current_hp',
+        'attack', 'defense', 'magic_attack', 'max_mana', 'current_mana', 'mana_regen', 'health_regen',
+        'crit_chance', 'crit_damage', 'dodge_chance', 'attack_speed', 'luck',
+        'dodged_last_attack', 'deck', 'active_cards', '_weapon_cards', '_weapon_damage', '_has_magic_weapon',
+        '_rage_multiplier', '_ancestral_rage_multiplier',
+        'has_unparalleled_swiftness', 'has_reactive_armor', 'has_lucky_7',
+        'has_mana_amplifier', 'has_mana_conduit', 'has_titans_strength',
+        'has_arcane_tome_wielder', 'has_berserkers_rage', 'has_barrier', 'has_unending_rage',
+        'has_barrier_permanence', 'has_dual_cast', 'has_quick_meteor', 'has_spellblade',
+        'has_impaler_weapon', 'has_arcane_battery', 'has_ogres_sword', 'reactive_armor_active',
+        'lucky_7_failed_crit_rolls', 'lucky_7_failed_dodge_rolls', 'rage_stacks', 'shield',
+        'equipped_spell', 'channeling_spell', 'channeling_turns_remaining',
+        'channeling_damage', 'meteor_channeling', 'meteor_channeling_turns', 'meteor_damage',
+        'dot_effects', 'equipped_spell_2', 'battery_spell', 'battery_turn_counter',
+        'monsters_killed', 'total_damage_dealt', 'total_damage_taken', 'floors_cleared',
+        'total_turns_in_combat', 'crits_landed', 'dodges_made', 'level', 'current_xp',
+        'highest_floor', 'bounty', 'day', 'packs_remaining', 'ascension_slots',
+        'has_ancestral_rage', 'has_impaler', 'has_blood_magic', 'has_blind_master',
+        'has_finishing_strike', 'ancestral_rage_stacks',
+    )
+
     def __init__(self, name: str):
         self.name = name
         self.current_floor = 0
         self.is_alive = True
         self.escaped_floor = None  # Track which floor they escaped from
 
-        # Base stats (will be modified by cards)
-        self.base_hp = 100
-        self.base_attack = 10
-        self.base_defense = 5
-        self.base_magic_attack = 0
-        self.base_mana = 50
-        self.base_mana_regen = 10
-        self.base_health_regen = 5
-        self.base_crit_chance = 5.0  # Percentage
-        self.base_crit_damage = 1.5  # Multiplier (1.5 = 150% damage)
-        self.base_dodge_chance = 5.0  # Percentage
-        self.base_attack_speed = 1.0  # Attacks per turn
-        self.base_luck = 0  # Bonus luck stat
-
-        # Current stats
+        # Current stats (start at the class-level base stats)
         self.max_hp = self.base_hp
         self.current_hp = self.max_hp
         self.attack = self.base_attack
@@ -141,6 +283,11 @@ class Player:
         # Card system
         self.deck: List[Card] = []
         self.active_cards: List[Card] = []
+        self._weapon_cards: Tuple[Card, ...] = ()  # Weapon cards among active_cards (set in _apply_card_bonuses)
+        self._weapon_damage = 0  # Total damage of _weapon_cards (set in _apply_card_bonuses)
+        self._has_magic_weapon = False  # Any of _weapon_cards is a wand/staff/tome (set in _apply_card_bonuses)
+        self._rage_multiplier = 0  # Attack per rage stack, 5 with Berserker's Rage (set in _apply_card_bonuses)
+        self._ancestral_rage_multiplier = 0  # Attack per Ancestral Rage stack (set in _apply_card_bonuses)
 
         # Unique card special effects tracking
         self.has_unparalleled_swiftness = False
@@ -240,30 +387,58 @@ class Player:
 
         self._apply_card_bonuses()
 
+    def add_cards(self, cards: List[Card]):
+        """
+        Add several cards to the deck and active cards at once.
+        Bonuses are recomputed a single time instead of once per card.
+        """
+        self.deck.extend(cards)
+        self.active_cards.extend(cards)
+        self._apply_card_bonuses()
+
     def _apply_ascension_cards(self):
         """Detect which ascension cards are equipped."""
-        self.has_ancestral_rage = "Ancestral Rage" in self.ascension_slots
-        self.has_impaler = "Impaler" in self.ascension_slots
-        self.has_blood_magic = "Blood Magic" in self.ascension_slots
-        self.has_blind_master = "Blind Master" in self.ascension_slots
-        self.has_finishing_strike = "Finishing Strike" in self.ascension_slots
+        equipped = frozenset(self.ascension_slots)
+        self.has_ancestral_rage = "Ancestral Rage" in equipped
+        self.has_impaler = "Impaler" in equipped
+        self.has_blood_magic = "Blood Magic" in equipped
+        self.has_blind_master = "Blind Master" in equipped
+        self.has_finishing_strike = "Finishing Strike" in equipped
+
+    def validate_deck(self, cards: List[Card]) -> List[str]:
+        """
+        Check a candidate deck against the equipment limits without equipping it.
+        Returns a list of error messages (empty if the deck is valid).
+        """
+        return self._validate_equipment_limits(cards)
 
-    def _validate_equipment_limits(self) -> List[str]:
+    def _validate_equipment_limits(self, cards: Optional[List[Card]] = None) -> List[str]:
         """
         Validate equipment limits: weapons, accessories, and armor.
+        Checks the active cards unless another list of cards is given.
         Returns a list of error messages if validation fails.
         """
+        if cards is None:
+            cards = self.active_cards
         errors = []
 
-        # Check for Titan's Strength unique card
-        has_titans_strength = any(c.special_effect == "titans_strength" for c in self.active_cards)
-
-        # Count weapons by type
-        weapon_counts = {}
-        for card in self.active_cards:
-            if card.card_type == CardType.WEAPON and card.weapon_type:
-                weapon_type = card.weapon_type
-                weapon_counts[weapon_type] = weapon_counts.get(weapon_type, 0) + 1
+        # Count weapons and accessories by type, armor pieces, and look for Titan's Strength in one pass
+        has_titans_strength = False
+        weapon_counts = Counter()
+        accessory_counts = Counter()
+        armor_count = 0
+        for card in cards:
+            card_type = card.card_type
+            if card_type is CardType.WEAPON:
+                if card.weapon_type:
+                    weapon_counts[card.weapon_type] += 1
+            elif card_type is CardType.ACCESSORY:
+                if card.accessory_type:
+                    accessory_counts[card.accessory_type] += 1
+            elif card_type is CardType.ARMOR:
+                armor_count += 1
+            if card.special_effect == "titans_strength":
+                has_titans_strength = True
 
         # Validate each weapon type
         for weapon_type, count in weapon_counts.items():
@@ -271,12 +446,12 @@ class Player:
                 continue  # Single weapon is always OK
 
             # Check dual wielding rules
-            if weapon_type in [WeaponType.SWORD, WeaponType.WAND, WeaponType.SHIELD, WeaponType.QUIVER]:
+            if weapon_type in _FREE_DUAL_WIELD_TYPES:
                 # Swords, Wands, Shields, and Quivers can always be dual wielded
                 if count > 2:
                     errors.append(f"Cannot equip more than 2 {weapon_type.value}s (found {count})")
 
-            elif weapon_type in [WeaponType.GREATSWORD, WeaponType.AXE, WeaponType.SPEAR]:
+            elif weapon_type in _TITAN_DUAL_WIELD_TYPES:
                 # These require Titan's Strength for dual wielding
                 if not has_titans_strength:
                     errors.append(
@@ -285,7 +460,7 @@ class Player:
                 elif count > 2:
                     errors.append(f"Cannot equip more than 2 {weapon_type.value}s even with Titan's Strength (found {count})")
 
-            elif weapon_type == WeaponType.TOME:
+            elif weapon_type is WeaponType.TOME:
                 # Tome has special handling via Arcane Tome Wielder (allows up to 4)
                 # This is validated elsewhere, but we'll allow it here
                 pass
@@ -296,24 +471,16 @@ class Player:
                     f"Cannot dual wield {weapon_type.value}s - only 1 allowed (found {count})"
                 )
 
-        # Count accessories by type
-        accessory_counts = {}
-        for card in self.active_cards:
-            if card.card_type == CardType.ACCESSORY and card.accessory_type:
-                accessory_type = card.accessory_type
-                accessory_counts[accessory_type] = accessory_counts.get(accessory_type, 0) + 1
-
         # Validate accessory limits
         for accessory_type, count in accessory_counts.items():
-            if accessory_type == AccessoryType.RING:
+            if accessory_type is AccessoryType.RING:
                 if count > 2:
                     errors.append(f"Cannot equip more than 2 {accessory_type.value}s (found {count})")
-            elif accessory_type == AccessoryType.AMULET:
+            elif accessory_type is AccessoryType.AMULET:
                 if count > 1:
                     errors.append(f"Cannot equip more than 1 {accessory_type.value} (found {count})")
 
-        # Count armor pieces
-        armor_count = sum(1 for card in self.active_cards if card.card_type == CardType.ARMOR)
+        # Validate armor limit
         if armor_count > 1:
             errors.append(f"Cannot equip more than 1 armor piece (found {armor_count})")
 
@@ -321,38 +488,39 @@ class Player:
 
     def _apply_card_bonuses(self):
         """Apply all stat bonuses from equipped cards, including unique card effects."""
-        # First, detect which unique cards are equipped
-        self.has_unparalleled_swiftness = any(c.special_effect == "unparalleled_swiftness" for c in self.active_cards)
-        self.has_reactive_armor = any(c.special_effect == "reactive_armor" for c in self.active_cards)
-        self.has_lucky_7 = any(c.special_effect == "lucky_7" for c in self.active_cards)
-        self.has_mana_amplifier = any(c.special_effect == "mana_amplifier" for c in self.active_cards)
-        self.has_mana_conduit = any(c.special_effect == "mana_conduit" for c in self.active_cards)
-        self.has_titans_strength = any(c.special_effect == "titans_strength" for c in self.active_cards)
-        self.has_arcane_tome_wielder = any(c.special_effect == "arcane_tome_wielder" for c in self.active_cards)
-        self.has_berserkers_rage = any(c.special_effect == "berserkers_rage" for c in self.active_cards)
-        self.has_barrier = any(c.special_effect == "barrier" for c in self.active_cards)
-        self.has_unending_rage = any(c.special_effect == "unending_rage" for c in self.active_cards)
-        self.has_barrier_permanence = any(c.special_effect == "barrier_permanence" for c in self.active_cards)
-        self.has_dual_cast = any(c.special_effect == "dual_cast" for c in self.active_cards)
-        self.has_quick_meteor = any(c.special_effect == "quick_meteor" for c in self.active_cards)
-        self.has_spellblade = any(c.special_effect == "spellblade" for c in self.active_cards)
-        self.has_impaler_weapon = any(c.special_effect == "impaler_weapon" for c in self.active_cards)
-        self.has_arcane_battery = any(c.special_effect == "arcane_battery" for c in self.active_cards)
-        self.has_ogres_sword = any(c.special_effect == "ogres_sword" for c in self.active_cards)
+        # Reset the unique card flags; the loop below sets those whose cards are equipped
+        for flag in _UNIQUE_EFFECT_FLAGS.values():
+            setattr(self, flag, False)
+
+        # Detect unique cards and sort the active cards into the groups used below in a single pass
+        stat_cards = []  # Everything except unique cards (those have special mechanics)
+        weapon_cards = []
+        spell_cards = []
+        for card in self.active_cards:
+            flag = _UNIQUE_EFFECT_FLAGS.get(card.special_effect)
+            if flag is not None:
+                setattr(self, flag, True)
+            card_class = card.card_class
+            if card_class is not CardClass.UNIQUE:
+                stat_cards.append(card)
+                if card_class is CardClass.SPELL:
+                    spell_cards.append(card)
+            if card.card_type is CardType.WEAPON:
+                weapon_cards.append(card)
+
+        # Weapon cards are looked up every attack, so keep them (and their damage) around
+        self._weapon_cards = tuple(weapon_cards)
+        self._weapon_damage = sum(map(_get_damage, weapon_cards))
+        self._has_magic_weapon = any(card.weapon_type in _MAGIC_WEAPON_TYPES for card in weapon_cards)
+        # +5 attack per rage stack; zero when the card/ascension isn't equipped
+        self._rage_multiplier = 5 if self.has_berserkers_rage else 0
+        self._ancestral_rage_multiplier = 5 if self.has_ancestral_rage else 0
 
         # Calculate base bonuses (excluding unique cards with special mechanics)
-        total_hp_bonus = sum(card.hp_bonus for card in self.active_cards if card.card_class != CardClass.UNIQUE)
-        total_attack_bonus = sum(card.attack_bonus for card in self.active_cards if card.card_class != CardClass.UNIQUE)
-        total_defense_bonus = sum(card.defense_bonus for card in self.active_cards if card.card_class != CardClass.UNIQUE)
-        total_magic_attack_bonus = sum(card.magic_attack_bonus for card in self.active_cards if card.card_class != CardClass.UNIQUE)
-        total_mana_bonus = sum(card.mana_bonus for card in self.active_cards if card.card_class != CardClass.UNIQUE)
-        total_mana_regen_bonus = sum(card.mana_regen_bonus for card in self.active_cards if card.card_class != CardClass.UNIQUE)
-        total_health_regen_bonus = sum(card.health_regen_bonus for card in self.active_cards if card.card_class != CardClass.UNIQUE)
-        total_crit_chance_bonus = sum(card.crit_chance_bonus for card in self.active_cards if card.card_class != CardClass.UNIQUE)
-        total_crit_damage_bonus = sum(card.crit_damage_bonus for card in self.active_cards if card.card_class != CardClass.UNIQUE)
-        total_dodge_chance_bonus = sum(card.dodge_chance_bonus for card in self.active_cards if card.card_class != CardClass.UNIQUE)
-        total_attack_speed_bonus = sum(card.attack_speed_bonus for card in self.active_cards if card.card_class != CardClass.UNIQUE)
-        total_luck_bonus = sum(card.luck_bonus for card in self.active_cards if card.card_class != CardClass.UNIQUE)
+        (total_hp_bonus, total_attack_bonus, total_defense_bonus, total_magic_attack_bonus,
+         total_mana_bonus, total_mana_regen_bonus, total_health_regen_bonus,
+         total_crit_chance_bonus, total_crit_damage_bonus, total_dodge_chance_bonus,
+         total_attack_speed_bonus, total_luck_bonus) = _sum_card_bonuses(stat_cards)
 
         # Apply base stats
         self.max_hp = self.base_hp + total_hp_bonus
@@ -392,7 +560,8 @@ class Player:
         # Arcane Tome Wielder: -100% attack, +25% magic attack per tome equipped
         if self.has_arcane_tome_wielder:
             self.attack = 0
-            num_tomes = sum(1 for card in self.active_cards if card.name == "Tome")
+            # Tomes are weapon cards, so only the (usually short) weapon list needs scanning
+            num_tomes = sum(1 for card in self._weapon_cards if card.name == "Tome")
             # Ensure max 4 tomes count (validation should be done elsewhere)
             num_tomes = min(num_tomes, 4)
             self.magic_attack = int(self.magic_attack * (1.0 + 0.25 * num_tomes))
@@ -407,7 +576,6 @@ class Player:
             self.crit_chance = 0.0
 
         # Equip spell cards
-        spell_cards = [card for card in self.active_cards if card.card_class == CardClass.SPELL]
         if spell_cards:
             # Equip the first spell card (priority order: as they appear in deck)
             self.equipped_spell = spell_cards[0]
@@ -431,11 +599,13 @@ class Player:
         Returns True if player escaped (hit 1 HP).
         Handles Reactive Armor and Barrier unique card effects.
         """
-        actual_damage = max(1, damage - self.defense)
+        actual_damage = damage - self.defense
+        if actual_damage < 1:
+            actual_damage = 1  # Always at least 1 damage
 
         # Reactive Armor: Apply 50% reduction if active
         if self.has_reactive_armor and self.reactive_armor_active:
-            actual_damage = int(actual_damage * 0.5)
+            actual_damage >>= 1  # Halve (damage is a positive int here)
             self.reactive_armor_active = False  # Consumed the protection
             if not silent:
                 print(f"  🛡️ Reactive Armor reduces damage by 50%!")
@@ -459,9 +629,9 @@ class Player:
             self.current_hp -= actual_damage
             self.total_damage_taken += actual_damage
 
-        # Reactive Armor: Activate for next hit (if we have the card and took damage)
-        if self.has_reactive_armor and actual_damage > 0:
-            self.reactive_armor_active = True
+            # Reactive Armor: Activate for next hit (if we have the card)
+            if self.has_reactive_armor:
+                self.reactive_armor_active = True
 
         if self.current_hp <= 1:
             self.current_hp = 1
@@ -476,14 +646,9 @@ class Player:
 
     def get_weapon_damage(self) -> int:
         """Calculate total damage from weapon cards and rage bonus."""
-        weapon_damage = sum(card.damage for card in self.active_cards
-                          if card.card_type == CardType.WEAPON)
-        rage_bonus = self.rage_stacks * 5 if self.has_berserkers_rage else 0
-
-        # Ancestral Rage: bonus from stacks
-        ancestral_rage_bonus = self.ancestral_rage_stacks * 5 if self.has_ancestral_rage else 0
-
-        return self.attack + weapon_damage + rage_bonus + ancestral_rage_bonus
+        return (self.attack + self._weapon_damage
+                + self.rage_stacks * self._rage_multiplier
+                + self.ancestral_rage_stacks * self._ancestral_rage_multiplier)  # Ancestral Rage bonus
 
     def get_attack_speed(self) -> float:
         """Calculate attack speed including Ancestral Rage bonus."""
@@ -497,19 +662,17 @@ class Player:
 
     def regenerate_mana(self):
         """Regenerate mana at the start of each turn."""
-        self.current_mana = min(self.current_mana + self.mana_regen, self.max_mana)
+        mana = self.current_mana + self.mana_regen
+        self.current_mana = mana if mana <= self.max_mana else self.max_mana
 
     def regenerate_health(self):
         """Regenerate health at the start of each turn."""
-        self.current_hp = min(self.current_hp + self.health_regen, self.max_hp)
+        hp = self.current_hp + self.health_regen
+        self.current_hp = hp if hp <= self.max_hp else self.max_hp
 
     def has_magic_weapon(self) -> bool:
         """Check if player has a magic weapon equipped (Wand, Staff, or Tome)."""
-        magic_weapon_types = [WeaponType.WAND, WeaponType.STAFF, WeaponType.TOME]
-        for card in self.active_cards:
-            if card.card_type == CardType.WEAPON and card.weapon_type in magic_weapon_types:
-                return True
-        return False
+        return self._has_magic_weapon
 
     def can_cast_spells(self) -> bool:
         """Check if player can cast spells (has magic weapon or Spellblade)."""
@@ -520,34 +683,27 @@ class Player:
         if self.dodged_last_attack:
             return False
 
-        # Lucky 7: Check if we should guarantee the luck roll
-        lucky_7_guaranteed = False
+        # Luck can trigger a second roll. Lucky 7 guarantees the luck roll
+        # after 7 failed ones in a row.
+        luck_triggered = False
         if self.has_lucky_7 and self.lucky_7_failed_dodge_rolls >= 7:
-            lucky_7_guaranteed = True
             self.lucky_7_failed_dodge_rolls = 0  # Reset counter
             if not silent:
                 print(f"  🎰 Lucky 7 activates! Luck roll guaranteed!")
+            luck_triggered = self.luck > 0
+        elif self.luck > 0:
+            luck_triggered = _roll_percent() <= self.luck
 
-        # Use luck to potentially roll twice
-        luck_triggered = False
-        if self.luck > 0:
-            if lucky_7_guaranteed:
-                luck_triggered = True
-            else:
-                luck_roll = random.randint(1, 100)
-                luck_triggered = luck_roll <= self.luck
-
-                # Track failed luck rolls for Lucky 7
-                if not luck_triggered and self.has_lucky_7:
-                    self.lucky_7_failed_dodge_rolls += 1
+            # Track failed luck rolls for Lucky 7
+            if not luck_triggered and self.has_lucky_7:
+                self.lucky_7_failed_dodge_rolls += 1
 
         if luck_triggered:
             # Roll twice, take the better result
-            roll1 = random.randint(1, 100)
-            roll2 = random.randint(1, 100)
+            roll1, roll2 = _roll_percent_pair()
             success = max(roll1, roll2) <= self.dodge_chance
         else:
-            success = random.randint(1, 100) <= self.dodge_chance
+            success = _roll_percent() <= self.dodge_chance
 
         self.dodged_last_attack = success
         if success:
@@ -559,35 +715,27 @@ class Player:
         Calculate damage with crit chance. Handles Lucky 7.
         Returns (damage, is_crit).
         """
-        # Lucky 7: Check if we should guarantee the luck roll
-        lucky_7_guaranteed = False
+        # Luck can trigger a second roll. Lucky 7 guarantees the luck roll
+        # after 7 failed ones in a row.
+        luck_triggered = False
         if self.has_lucky_7 and self.lucky_7_failed_crit_rolls >= 7:
-            lucky_7_guaranteed = True
             self.lucky_7_failed_crit_rolls = 0  # Reset counter
             if not silent:
                 print(f"  🎰 Lucky 7 activates! Luck roll guaranteed!")
+            luck_triggered = self.luck > 0
+        elif self.luck > 0:
+            luck_triggered = _roll_percent() <= self.luck
 
-        # Check for crit with luck
-        is_crit = False
-        luck_triggered = False
-        if self.luck > 0:
-            if lucky_7_guaranteed:
-                luck_triggered = True
-            else:
-                luck_roll = random.randint(1, 100)
-                luck_triggered = luck_roll <= self.luck
-
-                # Track failed luck rolls for Lucky 7
-                if not luck_triggered and self.has_lucky_7:
-                    self.lucky_7_failed_crit_rolls += 1
+            # Track failed luck rolls for Lucky 7
+            if not luck_triggered and self.has_lucky_7:
+                self.lucky_7_failed_crit_rolls += 1
 
         if luck_triggered:
             # Roll twice, take the better result (min for crit because lower is better)
-            roll1 = random.randint(1, 100)
-            roll2 = random.randint(1, 100)
+            roll1, roll2 = _roll_percent_pair()
             is_crit = min(roll1, roll2) <= self.crit_chance
         else:
-            is_crit = random.randint(1, 100) <= self.crit_chance
+            is_crit = _roll_percent() <= self.crit_chance
 
         if is_crit:
             self.crits_landed += 1
@@ -619,6 +767,8 @@ class Player:
     def get_xp_for_next_level(self) -> int:
         """Calculate XP required to reach the next level."""
         # Formula: level*level*1000 + (level//10*10000)
+        if 0 <= self.level < len(_XP_FOR_NEXT_LEVEL):
+            return _XP_FOR_NEXT_LEVEL[self.level]
         return self.level * self.level * 1000 + (self.level // 10 * 10000)
 
     def get_xp_from_floor(self, floor: int) -> int:
@@ -627,6 +777,8 @@ class Player:
         # floor 1: 100
         # floor 2: 100 * 1.1 = 110
         # floor 3: 100 * 1.1^2 = 121
+        if 0 <= floor < len(_XP_FROM_FLOOR):
+            return _XP_FROM_FLOOR[floor]
         return int(100 * (1.1 ** (floor - 1)))
 
     def get_floor_bonus_packs(self) -> int:
@@ -660,21 +812,19 @@ class Player:
 
         # Check for level ups (can level up multiple times if enough XP)
         leveled_up = False
-        while self.level < 20 and self.current_xp >= self.get_xp_for_next_level():
-            self.current_xp -= self.get_xp_for_next_level()
-            old_level = self.level
+        while self.level < 20 and self.current_xp >= _XP_FOR_NEXT_LEVEL[self.level]:
+            self.current_xp -= _XP_FOR_NEXT_LEVEL[self.level]
             self.level += 1
             leveled_up = True
 
-            # Calculate pack increase
-            if self.level == 20:
-                pack_increase = 2  # Level 20 gives +2
-            else:
-                pack_increase = 1  # Other levels give +1
-
-            new_max_packs = self.get_max_packs()
-
             if not silent:
+                # Calculate pack increase (only needed for the message)
+                if self.level == 20:
+                    pack_increase = 2  # Level 20 gives +2
+                else:
+                    pack_increase = 1  # Other levels give +1
+                new_max_packs = self.get_max_packs()
+
                 print(f"  🎉 LEVEL UP! {self.name} reached level {self.level}!")
                 print(f"  📦 Max packs increased by +{pack_increase}! (Next run: {new_max_packs} packs)")
 
@@ -698,12 +848,37 @@ class Player:
 
 
 # Save/Load System
+def _encode_save_data(save_data: dict, pretty: bool = False) -> bytes:
+    """Serialize save data to JSON bytes (compact unless pretty), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(save_data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(save_data, indent=2).encode('utf-8')
+    return json.dumps(save_data, separators=(',', ':')).encode('utf-8')
+
+
+def _decode_save_data(raw: bytes) -> dict:
+    """Parse JSON save data bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _save_target_name(target) -> str:
+    """Describe a save path or file-like object for status messages."""
+    if isinstance(target, (str, os.PathLike)):
+        return os.fspath(target)
+    return getattr(target, 'name', 'memory')
+
+
 def card_to_dict(card: Card) -> dict:
     """Convert a Card object to a dictionary for JSON serialization."""
+    # Enum members keep their value in `_value_`; reading it directly skips the
+    # `value` property lookup, which dominates the cost of this conversion
     return {
         'name': card.name,
-        'card_type': card.card_type.value if card.card_type else None,
-        'card_class': card.card_class.value if card.card_class else None,
+        'card_type': card.card_type._value_ if card.card_type else None,
+        'card_class': card.card_class._value_ if card.card_class else None,
         'description': card.description,
         'hp_bonus': card.hp_bonus,
         'attack_bonus': card.attack_bonus,
@@ -717,8 +892,8 @@ def card_to_dict(card: Card) -> dict:
         'dodge_chance_bonus': card.dodge_chance_bonus,
         'attack_speed_bonus': card.attack_speed_bonus,
         'luck_bonus': card.luck_bonus,
-        'weapon_type': card.weapon_type.value if card.weapon_type else None,
-        'accessory_type': card.accessory_type.value if card.accessory_type else None,
+        'weapon_type': card.weapon_type._value_ if card.weapon_type else None,
+        'accessory_type': card.accessory_type._value_ if card.accessory_type else None,
         'damage': card.damage,
         'magic_damage': card.magic_damage,
         'mana_cost': card.mana_cost,
@@ -757,8 +932,22 @@ def dict_to_card(card_dict: dict) -> Card:
     return card
 
 
-def save_game(players: List[Player], filename: str = "save_game.json"):
-    """Save all players' progress to a single JSON file."""
+def _intern_card(card_dict: dict, registry: dict) -> Card:
+    """Return the registry's Card for this saved card, creating it on first sight."""
+    key = tuple(sorted(card_dict.items()))
+    card = registry.get(key)
+    if card is None:
+        card = registry[key] = dict_to_card(card_dict)
+    return card
+
+
+def _players_to_save_data(players: List[Player], deck_overrides: Optional[Dict[Player, List[Card]]] = None) -> dict:
+    """
+    Build the plain save data dictionary for a list of players.
+    `deck_overrides` maps a player to the cards to save in place of their deck.
+    """
+    if deck_overrides is None:
+        deck_overrides = {}
     save_data = {
         'num_players': len(players),
         'players': []
@@ -774,38 +963,59 @@ def save_game(players: List[Player], filename: str = "save_game.json"):
             'day': player.day,
             'packs_remaining': player.packs_remaining,
             'ascension_slots': player.ascension_slots,
-            'deck': [card_to_dict(card) for card in player.deck]
+            'deck': [card_to_dict(card) for card in deck_overrides.get(player, player.deck)]
         }
         save_data['players'].append(player_data)
 
-    with open(filename, 'w') as f:
-        json.dump(save_data, f, indent=2)
+    return save_data
+
+
+def _players_from_save_data(save_data: dict) -> List[Player]:
+    """Recreate players from a save data dictionary."""
+    # Identical saved cards share one Card object, just like cards drawn from the pools
+    card_registry = {}
+    players = []
+    for player_data in save_data['players']:
+        # Create player with saved data
+        player = Player(player_data['name'])
+        player.level = player_data['level']
+        player.current_xp = player_data['current_xp']
+        player.highest_floor = player_data['highest_floor']
+        player.bounty = player_data['bounty']
+        player.day = player_data.get('day', 1)  # Default to 1 for backwards compatibility
+        player.packs_remaining = player_data.get('packs_remaining', 0)  # Default to 0 for backwards compatibility
+        player.ascension_slots = player_data['ascension_slots']
+        player.deck = [_intern_card(card_dict, card_registry) for card_dict in player_data['deck']]
+        players.append(player)
+    return players
+
+
+def _save_players(players: List[Player], filename: Union[str, os.PathLike, BinaryIO], encode,
+                  deck_overrides: Optional[Dict[Player, List[Card]]] = None):
+    """Encode players with `encode` and write them to a path or binary file object."""
+    raw = encode(_players_to_save_data(players, deck_overrides))
+    if isinstance(filename, (str, os.PathLike)):
+        with open(filename, 'wb', buffering=SAVE_IO_BUFFER) as f:
+            f.write(raw)
+    else:
+        filename.write(raw)
 
-    print(f"\n💾 Game saved to {filename}")
+    print(f"\n💾 Game saved to {_save_target_name(filename)}")
     print(f"   Saved {len(players)} player(s): {', '.join([p.name for p in players])}")
 
 
-def load_game(filename: str = "save_game.json") -> Optional[List[Player]]:
-    """Load all players' progress from a JSON file."""
+def _load_players(filename: Union[str, os.PathLike, BinaryIO], decode) -> Optional[List[Player]]:
+    """Read a path or binary file object and decode it with `decode` into players."""
     try:
-        with open(filename, 'r') as f:
-            save_data = json.load(f)
+        if isinstance(filename, (str, os.PathLike)):
+            with open(filename, 'rb', buffering=SAVE_IO_BUFFER) as f:
+                save_data = decode(f.read())
+        else:
+            save_data = decode(filename.read())
 
-        players = []
-        for player_data in save_data['players']:
-            # Create player with saved data
-            player = Player(player_data['name'])
-            player.level = player_data['level']
-            player.current_xp = player_data['current_xp']
-            player.highest_floor = player_data['highest_floor']
-            player.bounty = player_data['bounty']
-            player.day = player_data.get('day', 1)  # Default to 1 for backwards compatibility
-            player.packs_remaining = player_data.get('packs_remaining', 0)  # Default to 0 for backwards compatibility
-            player.ascension_slots = player_data['ascension_slots']
-            player.deck = [dict_to_card(card_dict) for card_dict in player_data['deck']]
-            players.append(player)
-
-        print(f"\n📂 Game loaded from {filename}")
+        players = _players_from_save_data(save_data)
+
+        print(f"\n📂 Game loaded from {_save_target_name(filename)}")
         print(f"   {len(players)} player(s) loaded:")
         for player in players:
             print(f"   - {player.name}: Level {player.level} | Bounty: {player.bounty} | Highest Floor: {player.highest_floor}")
@@ -818,6 +1028,60 @@ def load_game(filename: str = "save_game.json") -> Optional[List[Player]]:
         return None
 
 
+def save_game(players: List[Player], filename: Union[str, os.PathLike, BinaryIO] = "save_game.json",
+              pretty: bool = False, deck_overrides: Optional[Dict[Player, List[Card]]] = None):
+    """
+    Save all players' progress to a single JSON file.
+
+    `filename` may also be a binary file-like object (e.g. io.BytesIO), in
+    which case the save data is written to it directly. The JSON is compact
+    unless `pretty` is set, which indents it for reading by hand.
+    `deck_overrides` saves the given cards for a player instead of player.deck
+    (e.g. cards collected during prep that are not equipped yet).
+    """
+    _save_players(players, filename, functools.partial(_encode_save_data, pretty=pretty), deck_overrides)
+
+
+def load_game(filename: Union[str, os.PathLike, BinaryIO] = "save_game.json") -> Optional[List[Player]]:
+    """
+    Load all players' progress from a JSON file.
+
+    `filename` may also be a binary file-like object opened for reading.
+    """
+    return _load_players(filename, _decode_save_data)
+
+
+class _SaveDataUnpickler(pickle.Unpickler):
+    """Unpickler for binary saves - only plain containers and scalars are allowed."""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Unexpected object in save file: {module}.{name}")
+
+
+def _encode_binary_save_data(save_data: dict) -> bytes:
+    """Serialize save data with pickle protocol 5."""
+    return pickle.dumps(save_data, protocol=5)
+
+
+def _decode_binary_save_data(raw: bytes) -> dict:
+    """Parse binary save data, refusing anything but plain containers and scalars."""
+    return _SaveDataUnpickler(io.BytesIO(raw)).load()
+
+
+def save_game_binary(players: List[Player], filename: Union[str, os.PathLike, BinaryIO] = "save_game.sav",
+                     deck_overrides: Optional[Dict[Player, List[Card]]] = None):
+    """
+    Save all players' progress in the compact binary format.
+    Holds the same data as save_game, without the JSON text overhead.
+    """
+    _save_players(players, filename, _encode_binary_save_data, deck_overrides)
+
+
+def load_game_binary(filename: Union[str, os.PathLike, BinaryIO] = "save_game.sav") -> Optional[List[Player]]:
+    """Load all players' progress from a binary save written by save_game_binary."""
+    return _load_players(filename, _decode_binary_save_data)
+
+
 class EnemyType(Enum):
     """Different enemy types with different scaling patterns."""
     GOBLIN = "Goblin"
@@ -833,225 +1097,268 @@ class EnemyType(Enum):
     SORCERER = "Sorcerer"
 
 
+# All enemy types, for random selection without rebuilding the list each spawn
+_ENEMY_TYPES = tuple(EnemyType)
+
+# Enemy name prefixes by floor tier (one tier every 200 floors)
+_ENEMY_NAME_PREFIXES = ("Lesser", "Common", "Greater", "Elite", "Ancient", "Legendary")
+_ENEMY_MAX_TIER = len(_ENEMY_NAME_PREFIXES) - 1
+
+# Every "<prefix> <type>" enemy name, built once: one dict per tier, keyed by type value
+# (string keys hash faster than EnemyType members)
+_ENEMY_NAMES = tuple(
+    {enemy_type._value_: f"{prefix} {enemy_type.value}" for enemy_type in EnemyType}
+    for prefix in _ENEMY_NAME_PREFIXES
+)
+
+# Per-type stat scaling factors, shared by every Enemy instead of rebuilt per call
+_ENEMY_HP_SCALING = {
+    EnemyType.SLIME: 1.2,      # High HP
+    EnemyType.GOLEM: 1.5,      # Very high HP
+    EnemyType.GOBLIN: 0.8,     # Low HP
+    EnemyType.WRAITH: 0.9,     # Medium-low HP
+    EnemyType.SKELETON: 1.0,   # Medium HP
+    EnemyType.VAMPIRE: 1.1,    # Medium-high HP
+    EnemyType.DEMON: 1.0,      # Medium HP
+    EnemyType.DRAGON: 1.3,     # High HP
+    EnemyType.MAGE: 0.7,       # Low HP (glass cannon)
+    EnemyType.WARLOCK: 0.8,    # Low HP
+    EnemyType.SORCERER: 0.75,  # Low HP
+}
+
+_ENEMY_ATTACK_SCALING = {
+    EnemyType.DEMON: 1.4,      # Very high attack
+    EnemyType.DRAGON: 1.3,     # High attack
+    EnemyType.VAMPIRE: 1.2,    # Medium-high attack
+    EnemyType.GOBLIN: 1.1,     # Medium attack
+    EnemyType.SKELETON: 1.0,   # Medium attack
+    EnemyType.WRAITH: 1.1,     # Medium attack
+    EnemyType.SLIME: 0.7,      # Low attack
+    EnemyType.GOLEM: 0.8,      # Low attack
+    EnemyType.MAGE: 0.5,       # Very low physical attack (magic users)
+    EnemyType.WARLOCK: 0.4,    # Very low physical attack
+    EnemyType.SORCERER: 0.3,   # Very low physical attack
+}
+
+_ENEMY_DEFENSE_SCALING = {
+    EnemyType.GOLEM: 1.8,      # Very high defense
+    EnemyType.DRAGON: 1.4,     # High defense
+    EnemyType.SKELETON: 1.2,   # Medium-high defense
+    EnemyType.DEMON: 1.1,      # Medium defense
+    EnemyType.VAMPIRE: 1.0,    # Medium defense
+    EnemyType.SLIME: 0.8,      # Low defense
+    EnemyType.GOBLIN: 0.6,     # Very low defense
+    EnemyType.WRAITH: 0.5,     # Very low defense
+    EnemyType.MAGE: 0.4,       # Very low defense (glass cannon)
+    EnemyType.WARLOCK: 0.5,    # Very low defense
+    EnemyType.SORCERER: 0.4,   # Very low defense
+}
+
+_ENEMY_MAGIC_ATTACK_SCALING = {
+    EnemyType.SORCERER: 1.5,   # Very high magic attack
+    EnemyType.WARLOCK: 1.4,    # High magic attack
+    EnemyType.MAGE: 1.3,       # High magic attack
+    EnemyType.DEMON: 1.1,      # Medium magic attack
+    EnemyType.DRAGON: 1.0,     # Medium magic attack
+    EnemyType.WRAITH: 0.9,     # Low magic attack
+    EnemyType.VAMPIRE: 0.5,    # Very low magic attack
+    # Others have negligible magic attack
+}
+
+_ENEMY_MANA_SCALING = {
+    EnemyType.SORCERER: 1.3,
+    EnemyType.WARLOCK: 1.2,
+    EnemyType.MAGE: 1.1,
+    EnemyType.DEMON: 0.8,
+    EnemyType.WRAITH: 0.6,
+}
+
+_ENEMY_MANA_REGEN_SCALING = {
+    EnemyType.SORCERER: 1.2,
+    EnemyType.WARLOCK: 1.1,
+    EnemyType.MAGE: 1.0,
+    EnemyType.DEMON: 0.7,
+    EnemyType.WRAITH: 0.5,
+}
+
+_ENEMY_CRIT_CHANCE_SCALING = {
+    EnemyType.VAMPIRE: 1.8,    # Very high crit
+    EnemyType.DEMON: 1.5,      # High crit
+    EnemyType.GOBLIN: 1.3,     # Medium-high crit
+    EnemyType.WRAITH: 1.2,     # Medium crit
+    EnemyType.SORCERER: 1.1,   # Medium crit
+    EnemyType.GOLEM: 0.3,      # Very low crit
+    EnemyType.SLIME: 0.5,      # Low crit
+}
+
+_ENEMY_CRIT_DAMAGE_SCALING = {
+    EnemyType.VAMPIRE: 1.4,
+    EnemyType.DEMON: 1.3,
+    EnemyType.DRAGON: 1.2,
+    EnemyType.SORCERER: 1.2,
+}
+
+_ENEMY_DODGE_CHANCE_SCALING = {
+    EnemyType.WRAITH: 2.0,     # Very high dodge
+    EnemyType.GOBLIN: 1.5,     # High dodge
+    EnemyType.VAMPIRE: 1.3,    # Medium-high dodge
+    EnemyType.MAGE: 1.2,       # Medium dodge
+    EnemyType.GOLEM: 0.2,      # Very low dodge
+    EnemyType.DRAGON: 0.3,     # Very low dodge
+    EnemyType.SLIME: 0.4,      # Low dodge
+}
+
+_ENEMY_ATTACK_SPEED_SCALING = {
+    EnemyType.GOBLIN: 1.3,     # Fast attacks
+    EnemyType.VAMPIRE: 1.2,    # Fast attacks
+    EnemyType.WRAITH: 1.2,     # Fast attacks
+    EnemyType.GOLEM: 0.7,      # Slow attacks
+    EnemyType.DRAGON: 0.8,     # Slow attacks
+}
+
+_ENEMY_LUCK_SCALING = {
+    EnemyType.GOBLIN: 1.5,
+    EnemyType.VAMPIRE: 1.2,
+    EnemyType.DEMON: 1.0,
+}
+
+# All eleven factors for each type in one row, in scaled_stats order. Types missing
+# from a table use 1.0, except the magic, mana and luck stats which default to 0.0.
+_ENEMY_STAT_FACTORS = {
+    enemy_type: (
+        _ENEMY_HP_SCALING.get(enemy_type, 1.0),
+        _ENEMY_ATTACK_SCALING.get(enemy_type, 1.0),
+        _ENEMY_DEFENSE_SCALING.get(enemy_type, 1.0),
+        _ENEMY_MAGIC_ATTACK_SCALING.get(enemy_type, 0.0),
+        _ENEMY_MANA_SCALING.get(enemy_type, 0.0),
+        _ENEMY_MANA_REGEN_SCALING.get(enemy_type, 0.0),
+        _ENEMY_CRIT_CHANCE_SCALING.get(enemy_type, 1.0),
+        _ENEMY_CRIT_DAMAGE_SCALING.get(enemy_type, 1.0),
+        _ENEMY_DODGE_CHANCE_SCALING.get(enemy_type, 1.0),
+        _ENEMY_ATTACK_SPEED_SCALING.get(enemy_type, 1.0),
+        _ENEMY_LUCK_SCALING.get(enemy_type, 0.0),
+    )
+    for enemy_type in EnemyType
+}
+
+
 class Enemy:
     """
     Enemy class with floor-based scaling.
     """
-    def __init__(self, floor: int, enemy_type: Optional[EnemyType] = None):
+    IS_PLAYER = False
+
+    __slots__ = (
+        'floor', 'enemy_type', 'name', 'max_hp', 'attack', 'defense', 'magic_attack',
+        'max_mana', 'mana_regen', 'crit_chance', 'crit_damage', 'dodge_chance', 'attack_speed',
+        'luck', 'current_hp', 'current_mana', 'dodged_last_attack', 'impaled', 'stunned',
+        'prefers_magic', '_dodge_probability', '_crit_probability',
+    )
+
+    def __init__(self, floor: int, enemy_type: EnemyType, stats: Optional[tuple] = None):
         self.floor = floor
-        self.enemy_type = enemy_type or random.choice(list(EnemyType))
+        self.enemy_type = enemy_type
         self.name = self._generate_name()
 
-        # Scale stats based on floor
-        self.max_hp = self._scale_hp(floor)
+        # Scale stats based on floor (or reuse precomputed ones, see Tower)
+        if stats is None:
+            stats = Enemy.scaled_stats(floor, enemy_type)
+        (self.max_hp, self.attack, self.defense, self.magic_attack, self.max_mana,
+         self.mana_regen, self.crit_chance, self.crit_damage, self.dodge_chance,
+         self.attack_speed, self.luck) = stats
         self.current_hp = self.max_hp
-        self.attack = self._scale_attack(floor)
-        self.defense = self._scale_defense(floor)
-        self.magic_attack = self._scale_magic_attack(floor)
-        self.max_mana = self._scale_mana(floor)
         self.current_mana = self.max_mana
-        self.mana_regen = self._scale_mana_regen(floor)
-        self.crit_chance = self._scale_crit_chance(floor)
-        self.crit_damage = self._scale_crit_damage(floor)
-        self.dodge_chance = self._scale_dodge_chance(floor)
-        self.attack_speed = self._scale_attack_speed(floor)
-        self.luck = self._scale_luck(floor)
+        # Stats never change, so whether magic hits harder is decided once
+        self.prefers_magic = self.magic_attack > 0 and self.magic_attack > self.attack
+
+        # Same for the dodge and crit odds. With luck (luck% of the time) two 1-100 rolls
+        # are made and the better one kept (max for dodge, min for crit), which works out to:
+        luck_hit = _percent_roll_hits(self.luck) if self.luck > 0 else 0.0
+        dodge_hit = _percent_roll_hits(self.dodge_chance)
+        crit_hit = _percent_roll_hits(self.crit_chance)
+        self._dodge_probability = luck_hit * dodge_hit * dodge_hit + (1 - luck_hit) * dodge_hit
+        self._crit_probability = luck_hit * (1 - (1 - crit_hit) ** 2) + (1 - luck_hit) * crit_hit
 
         # Combat state
         self.dodged_last_attack = False
         self.impaled = False  # Impale status from Impaler ascension card
         self.stunned = False  # Stun status from Ogre's Sword
 
+    @classmethod
+    def spawn(cls, floor: int, stats_cache: Optional[dict] = None) -> 'Enemy':
+        """
+        Create an enemy of a random type for the given floor.
+        Pass a stats_cache to share scaled stats per (floor, type), like Tower does.
+        """
+        enemy_type = _ENEMY_TYPES[random.randrange(len(_ENEMY_TYPES))]
+        if stats_cache is None:
+            return cls(floor, enemy_type)
+        return cls.from_stats_cache(floor, enemy_type, stats_cache)
+
+    @classmethod
+    def from_stats_cache(cls, floor: int, enemy_type: EnemyType, stats_cache: dict) -> 'Enemy':
+        """Create an enemy, reusing (or filling) its scaled stats in a (floor, type) cache."""
+        stats = stats_cache.get((floor, enemy_type))
+        if stats is None:
+            stats = stats_cache[(floor, enemy_type)] = cls.scaled_stats(floor, enemy_type)
+        return cls(floor, enemy_type, stats)
+
+    @classmethod
+    def spawn_batch(cls, floors: List[int], stats_cache: Optional[dict] = None) -> List['Enemy']:
+        """
+        Create one enemy of a random type per floor, drawing all the types at once.
+        Scaled stats are computed once per (floor, type) and shared through stats_cache.
+        """
+        if stats_cache is None:
+            stats_cache = {}
+        enemy_types = random.choices(_ENEMY_TYPES, k=len(floors))
+        return [cls.from_stats_cache(floor, enemy_type, stats_cache)
+                for floor, enemy_type in zip(floors, enemy_types)]
+
     def _generate_name(self) -> str:
         """Generate enemy name based on floor and type."""
-        prefixes = ["Lesser", "Common", "Greater", "Elite", "Ancient", "Legendary"]
-        floor_tier = min(self.floor // 200, len(prefixes) - 1)
-        prefix = prefixes[floor_tier]
-        return f"{prefix} {self.enemy_type.value}"
-
-    def _scale_hp(self, floor: int) -> int:
-        """Scale HP based on floor number."""
-        base = 50
-        scaling_factor = {
-            EnemyType.SLIME: 1.2,      # High HP
-            EnemyType.GOLEM: 1.5,      # Very high HP
-            EnemyType.GOBLIN: 0.8,     # Low HP
-            EnemyType.WRAITH: 0.9,     # Medium-low HP
-            EnemyType.SKELETON: 1.0,   # Medium HP
-            EnemyType.VAMPIRE: 1.1,    # Medium-high HP
-            EnemyType.DEMON: 1.0,      # Medium HP
-            EnemyType.DRAGON: 1.3,     # High HP
-            EnemyType.MAGE: 0.7,       # Low HP (glass cannon)
-            EnemyType.WARLOCK: 0.8,    # Low HP
-            EnemyType.SORCERER: 0.75,  # Low HP
-        }
-        factor = scaling_factor.get(self.enemy_type, 1.0)
-        return int(base * factor + (floor * 2.5 * factor))
-
-    def _scale_attack(self, floor: int) -> int:
-        """Scale physical attack based on floor number."""
-        base = 8
-        scaling_factor = {
-            EnemyType.DEMON: 1.4,      # Very high attack
-            EnemyType.DRAGON: 1.3,     # High attack
-            EnemyType.VAMPIRE: 1.2,    # Medium-high attack
-            EnemyType.GOBLIN: 1.1,     # Medium attack
-            EnemyType.SKELETON: 1.0,   # Medium attack
-            EnemyType.WRAITH: 1.1,     # Medium attack
-            EnemyType.SLIME: 0.7,      # Low attack
-            EnemyType.GOLEM: 0.8,      # Low attack
-            EnemyType.MAGE: 0.5,       # Very low physical attack (magic users)
-            EnemyType.WARLOCK: 0.4,    # Very low physical attack
-            EnemyType.SORCERER: 0.3,   # Very low physical attack
-        }
-        factor = scaling_factor.get(self.enemy_type, 1.0)
-        return int(base * factor + (floor * 1.2 * factor))
-
-    def _scale_defense(self, floor: int) -> int:
-        """Scale defense based on floor number."""
-        base = 3
-        scaling_factor = {
-            EnemyType.GOLEM: 1.8,      # Very high defense
-            EnemyType.DRAGON: 1.4,     # High defense
-            EnemyType.SKELETON: 1.2,   # Medium-high defense
-            EnemyType.DEMON: 1.1,      # Medium defense
-            EnemyType.VAMPIRE: 1.0,    # Medium defense
-            EnemyType.SLIME: 0.8,      # Low defense
-            EnemyType.GOBLIN: 0.6,     # Very low defense
-            EnemyType.WRAITH: 0.5,     # Very low defense
-            EnemyType.MAGE: 0.4,       # Very low defense (glass cannon)
-            EnemyType.WARLOCK: 0.5,    # Very low defense
-            EnemyType.SORCERER: 0.4,   # Very low defense
-        }
-        factor = scaling_factor.get(self.enemy_type, 1.0)
-        return int(base * factor + (floor * 0.8 * factor))
-
-    def _scale_magic_attack(self, floor: int) -> int:
-        """Scale magic attack based on floor number."""
-        base = 10
-        scaling_factor = {
-            EnemyType.SORCERER: 1.5,   # Very high magic attack
-            EnemyType.WARLOCK: 1.4,    # High magic attack
-            EnemyType.MAGE: 1.3,       # High magic attack
-            EnemyType.DEMON: 1.1,      # Medium magic attack
-            EnemyType.DRAGON: 1.0,     # Medium magic attack
-            EnemyType.WRAITH: 0.9,     # Low magic attack
-            EnemyType.VAMPIRE: 0.5,    # Very low magic attack
-            # Others have negligible magic attack
-        }
-        factor = scaling_factor.get(self.enemy_type, 0.0)
-        return int(base * factor + (floor * 1.5 * factor))
-
-    def _scale_mana(self, floor: int) -> int:
-        """Scale max mana based on floor number."""
-        base = 100
-        scaling_factor = {
-            EnemyType.SORCERER: 1.3,
-            EnemyType.WARLOCK: 1.2,
-            EnemyType.MAGE: 1.1,
-            EnemyType.DEMON: 0.8,
-            EnemyType.WRAITH: 0.6,
-        }
-        factor = scaling_factor.get(self.enemy_type, 0.0)
-        return int(base * factor + (floor * 1.0 * factor))
-
-    def _scale_mana_regen(self, floor: int) -> int:
-        """Scale mana regen based on floor number."""
-        base = 15
-        scaling_factor = {
-            EnemyType.SORCERER: 1.2,
-            EnemyType.WARLOCK: 1.1,
-            EnemyType.MAGE: 1.0,
-            EnemyType.DEMON: 0.7,
-            EnemyType.WRAITH: 0.5,
-        }
-        factor = scaling_factor.get(self.enemy_type, 0.0)
-        return int(base * factor + (floor * 0.3 * factor))
-
-    def _scale_crit_chance(self, floor: int) -> float:
-        """Scale crit chance based on floor number."""
-        base = 5.0
-        scaling_factor = {
-            EnemyType.VAMPIRE: 1.8,    # Very high crit
-            EnemyType.DEMON: 1.5,      # High crit
-            EnemyType.GOBLIN: 1.3,     # Medium-high crit
-            EnemyType.WRAITH: 1.2,     # Medium crit
-            EnemyType.SORCERER: 1.1,   # Medium crit
-            EnemyType.GOLEM: 0.3,      # Very low crit
-            EnemyType.SLIME: 0.5,      # Low crit
-        }
-        factor = scaling_factor.get(self.enemy_type, 1.0)
-        return min(50.0, base * factor + (floor * 0.05 * factor))  # Cap at 50%
-
-    def _scale_crit_damage(self, floor: int) -> float:
-        """Scale crit damage multiplier based on floor number."""
-        base = 1.5
-        scaling_factor = {
-            EnemyType.VAMPIRE: 1.4,
-            EnemyType.DEMON: 1.3,
-            EnemyType.DRAGON: 1.2,
-            EnemyType.SORCERER: 1.2,
-        }
-        factor = scaling_factor.get(self.enemy_type, 1.0)
-        return base * factor + (floor * 0.001 * factor)  # Slow scaling
-
-    def _scale_dodge_chance(self, floor: int) -> float:
-        """Scale dodge chance based on floor number."""
-        base = 3.0
-        scaling_factor = {
-            EnemyType.WRAITH: 2.0,     # Very high dodge
-            EnemyType.GOBLIN: 1.5,     # High dodge
-            EnemyType.VAMPIRE: 1.3,    # Medium-high dodge
-            EnemyType.MAGE: 1.2,       # Medium dodge
-            EnemyType.GOLEM: 0.2,      # Very low dodge
-            EnemyType.DRAGON: 0.3,     # Very low dodge
-            EnemyType.SLIME: 0.4,      # Low dodge
-        }
-        factor = scaling_factor.get(self.enemy_type, 1.0)
-        return min(40.0, base * factor + (floor * 0.04 * factor))  # Cap at 40%
-
-    def _scale_attack_speed(self, floor: int) -> float:
-        """Scale attack speed based on floor number."""
-        base = 1.0
-        scaling_factor = {
-            EnemyType.GOBLIN: 1.3,     # Fast attacks
-            EnemyType.VAMPIRE: 1.2,    # Fast attacks
-            EnemyType.WRAITH: 1.2,     # Fast attacks
-            EnemyType.GOLEM: 0.7,      # Slow attacks
-            EnemyType.DRAGON: 0.8,     # Slow attacks
-        }
-        factor = scaling_factor.get(self.enemy_type, 1.0)
-        return base * factor + (floor * 0.001 * factor)  # Very slow scaling
-
-    def _scale_luck(self, floor: int) -> int:
-        """Scale luck based on floor number."""
-        base = 0
-        scaling_factor = {
-            EnemyType.GOBLIN: 1.5,
-            EnemyType.VAMPIRE: 1.2,
-            EnemyType.DEMON: 1.0,
-        }
-        factor = scaling_factor.get(self.enemy_type, 0.0)
-        return int(base + (floor * 0.02 * factor))
+        floor_tier = min(self.floor // 200, _ENEMY_MAX_TIER)
+        return _ENEMY_NAMES[floor_tier][self.enemy_type._value_]
+
+    @staticmethod
+    def scaled_stats(floor: int, enemy_type: EnemyType) -> tuple:
+        """
+        All floor-scaled stats for an enemy type, computed in one pass, in the order:
+        max_hp, attack, defense, magic_attack, max_mana, mana_regen,
+        crit_chance, crit_damage, dodge_chance, attack_speed, luck.
+
+        Each stat is base * factor + floor * per-floor rate * factor, with the
+        per-type factors taken from _ENEMY_STAT_FACTORS.
+        """
+        (hp_factor, attack_factor, defense_factor, magic_factor, mana_factor,
+         mana_regen_factor, crit_factor, crit_damage_factor, dodge_factor,
+         speed_factor, luck_factor) = _ENEMY_STAT_FACTORS[enemy_type]
+        return (
+            int(50 * hp_factor + (floor * 2.5 * hp_factor)),
+            int(8 * attack_factor + (floor * 1.2 * attack_factor)),
+            int(3 * defense_factor + (floor * 0.8 * defense_factor)),
+            int(10 * magic_factor + (floor * 1.5 * magic_factor)),
+            int(100 * mana_factor + (floor * 1.0 * mana_factor)),
+            int(15 * mana_regen_factor + (floor * 0.3 * mana_regen_factor)),
+            min(50.0, 5.0 * crit_factor + (floor * 0.05 * crit_factor)),  # Cap at 50%
+            1.5 * crit_damage_factor + (floor * 0.001 * crit_damage_factor),  # Slow scaling
+            min(40.0, 3.0 * dodge_factor + (floor * 0.04 * dodge_factor)),  # Cap at 40%
+            1.0 * speed_factor + (floor * 0.001 * speed_factor),  # Very slow scaling
+            int(0 + (floor * 0.02 * luck_factor)),
+        )
 
     def regenerate_mana(self):
-        """Regenerate mana at the start of each turn."""
-        if self.max_mana > 0:
-            self.current_mana = min(self.current_mana + self.mana_regen, self.max_mana)
+        """Regenerate mana at the start of each turn (battle only calls this for casters)."""
+        mana = self.current_mana + self.mana_regen
+        self.current_mana = mana if mana <= self.max_mana else self.max_mana
 
     def can_dodge(self, silent: bool = False) -> bool:
         """Check if enemy can dodge (can't dodge twice in a row)."""
         if self.dodged_last_attack:
             return False
 
-        # Use luck to potentially roll twice
-        if self.luck > 0 and random.randint(1, 100) <= self.luck:
-            roll1 = random.randint(1, 100)
-            roll2 = random.randint(1, 100)
-            success = max(roll1, roll2) <= self.dodge_chance
-        else:
-            success = random.randint(1, 100) <= self.dodge_chance
-
+        # One draw against the precomputed odds (luck included, see __init__)
+        success = _random() < self._dodge_probability
         self.dodged_last_attack = success
         return success
 
@@ -1060,15 +1367,8 @@ class Enemy:
         Calculate damage with crit chance.
         Returns (damage, is_crit).
         """
-        is_crit = False
-        if self.luck > 0 and random.randint(1, 100) <= self.luck:
-            roll1 = random.randint(1, 100)
-            roll2 = random.randint(1, 100)
-            is_crit = min(roll1, roll2) <= self.crit_chance
-        else:
-            is_crit = random.randint(1, 100) <= self.crit_chance
-
-        if is_crit:
+        # One draw against the precomputed odds (luck included, see __init__)
+        if _random() < self._crit_probability:
             return int(base_damage * self.crit_damage), True
         return base_damage, False
 
@@ -1077,7 +1377,9 @@ class Enemy:
         Enemy takes damage.
         Returns True if enemy is defeated.
         """
-        actual_damage = max(1, damage - self.defense)
+        actual_damage = damage - self.defense
+        if actual_damage < 1:
+            actual_damage = 1  # Always at least 1 damage
         self.current_hp -= actual_damage
         return self.current_hp <= 0
 
@@ -1100,10 +1402,12 @@ class Tower:
 
     def __init__(self):
         self.current_floor = 0
+        # Scaled enemy stats per (floor, enemy type) - they never change
+        self._enemy_stats = {}
 
     def generate_enemy(self, floor: int) -> Enemy:
         """Generate an enemy for the given floor."""
-        return Enemy(floor)
+        return Enemy.spawn(floor, self._enemy_stats)
 
     def generate_enemies(self, floor: int) -> List[Enemy]:
         """Generate multiple enemies for a floor (scales with floor number)."""
@@ -1111,7 +1415,13 @@ class Tower:
         num_enemies = 1 + (floor // 100)  # 1 enemy base, +1 every 100 floors
         num_enemies = min(num_enemies, 5)  # Cap at 5 enemies
 
-        return [self.generate_enemy(floor) for _ in range(num_enemies)]
+        return Enemy.spawn_batch([floor] * num_enemies, self._enemy_stats)
+
+
+# Fallback Bolt cast by magic users without an equipped spell (shared, never modified)
+_FALLBACK_BOLT = Card("Bolt", CardType.SPELL, CardClass.SPELL,
+                      "Fallback spell. Cost: 5 mana, Damage: 0.7x magic attack",
+                      mana_cost=5, special_effect="bolt")
 
 
 class Combat:
@@ -1124,15 +1434,12 @@ class Combat:
         Perform a single attack with dodge and crit mechanics.
         Returns (defender_defeated, actual_damage_dealt, is_crit).
         """
-        attacker_name = attacker.name if hasattr(attacker, 'name') else str(attacker)
-        defender_name = defender.name if hasattr(defender, 'name') else str(defender)
-
         # Check if defender dodges
         dodged = defender.can_dodge(silent=silent)
 
         if dodged:
             if not silent:
-                print(f"  💨 {defender_name} DODGED the attack!")
+                print(f"  💨 {defender.name} DODGED the attack!")
             return False, 0, False
 
         # If attack wasn't dodged, reset the dodge flag
@@ -1140,7 +1447,8 @@ class Combat:
 
         # Calculate damage with crit
         # Player has silent parameter, Enemy doesn't
-        if hasattr(attacker, 'total_damage_dealt'):
+        attacker_is_player = attacker.IS_PLAYER
+        if attacker_is_player:
             final_damage, is_crit = attacker.calculate_damage(damage, silent=silent)
         else:
             final_damage, is_crit = attacker.calculate_damage(damage)
@@ -1149,15 +1457,15 @@ class Combat:
         if not silent:
             crit_marker = " 💥 CRITICAL HIT!" if is_crit else ""
             type_marker = "⚡" if attack_type == "magic" else "⚔️"
-            print(f"  {type_marker} {attacker_name} attacks {defender_name} for {final_damage} damage!{crit_marker}")
+            print(f"  {type_marker} {attacker.name} attacks {defender.name} for {final_damage} damage!{crit_marker}")
 
         # Track damage dealt for players
-        if hasattr(attacker, 'total_damage_dealt'):
+        if attacker_is_player:
             attacker.total_damage_dealt += final_damage
 
         # Apply damage
         # Player has silent parameter, Enemy doesn't
-        if hasattr(defender, 'total_damage_taken'):
+        if defender.IS_PLAYER:
             defeated = defender.take_damage(final_damage, silent=silent)
         else:
             defeated = defender.take_damage(final_damage)
@@ -1165,7 +1473,27 @@ class Combat:
         return defeated, final_damage, is_crit
 
     @staticmethod
-    def _cast_spell(player: Player, spell: Card, enemies: List[Enemy], silent: bool = False) -> Tuple[int, bool]:
+    def _hit_all_enemies(player: Player, enemies: Deque[Enemy], damage: int, silent: bool = False) -> int:
+        """Hit every enemy with a magic attack, then drop the defeated ones in one pass."""
+        total_damage = 0
+        survivors = []
+        for target in enemies:
+            defeated, damage_dealt, is_crit = Combat._perform_attack(player, target, damage, "magic", silent=silent)
+            total_damage += damage_dealt
+            if defeated:
+                if not silent:
+                    print(f"  ✓ {target.name} defeated!")
+                player.monsters_killed += 1
+                player.gain_bounty(1, silent=silent)
+            else:
+                survivors.append(target)
+        if len(survivors) != len(enemies):
+            enemies.clear()
+            enemies.extend(survivors)
+        return total_damage
+
+    @staticmethod
+    def _cast_spell(player: Player, spell: Card, enemies: Deque[Enemy], silent: bool = False) -> Tuple[int, bool]:
         """
         Cast a spell and handle its special mechanics.
         Returns (total_damage_dealt, continue_to_next_attack).
@@ -1228,7 +1556,7 @@ class Combat:
                         print(f"  ✓ {target.name} defeated!")
                     player.monsters_killed += 1
                     player.gain_bounty(1, silent=silent)
-                    enemies.pop(0)
+                    enemies.popleft()
 
         elif spell_effect == "rapid_bolts":
             # Fire 3 bolts
@@ -1245,7 +1573,7 @@ class Combat:
                         print(f"  ✓ {target.name} defeated!")
                     player.monsters_killed += 1
                     player.gain_bounty(1, silent=silent)
-                    enemies.pop(0)
+                    enemies.popleft()
 
         elif spell_effect == "arcane_missiles":
             # Fire 5 missiles
@@ -1262,7 +1590,7 @@ class Combat:
                         print(f"  ✓ {target.name} defeated!")
                     player.monsters_killed += 1
                     player.gain_bounty(1, silent=silent)
-                    enemies.pop(0)
+                    enemies.popleft()
 
         elif spell_effect == "beam":
             # Start channeling for 3 turns
@@ -1281,7 +1609,7 @@ class Combat:
                         print(f"  ✓ {target.name} defeated!")
                     player.monsters_killed += 1
                     player.gain_bounty(1, silent=silent)
-                    enemies.pop(0)
+                    enemies.popleft()
 
         elif spell_effect == "meteor":
             # Quick Meteor: Instant cast with reduced damage (2x instead of 5x)
@@ -1291,15 +1619,7 @@ class Combat:
                 if not silent:
                     print(f"  🌠 Quick Meteor: Instant cast! (AOE)")
                 # Deal damage to all enemies
-                for enemy in enemies[:]:
-                    defeated, damage_dealt, is_crit = Combat._perform_attack(player, enemy, quick_meteor_damage, "magic", silent=silent)
-                    total_damage += damage_dealt
-                    if defeated:
-                        if not silent:
-                            print(f"  ✓ {enemy.name} defeated!")
-                        player.monsters_killed += 1
-                        player.gain_bounty(1, silent=silent)
-                        enemies.remove(enemy)
+                total_damage += Combat._hit_all_enemies(player, enemies, quick_meteor_damage, silent=silent)
             else:
                 # Normal Meteor: Start channeling for 2 turns
                 player.meteor_channeling = True
@@ -1327,26 +1647,18 @@ class Combat:
                         print(f"  ✓ {target.name} defeated!")
                     player.monsters_killed += 1
                     player.gain_bounty(1, silent=silent)
-                    enemies.pop(0)
+                    enemies.popleft()
 
         elif spell_effect in ["chain_lightning", "inferno", "frost_nova", "flame_burst"]:
             # AOE spells - hit all enemies
             if not silent:
                 print(f"  💥 {spell.name}: Hitting all enemies!")
-            for target in enemies[:]:  # Copy list
-                defeated, damage_dealt, is_crit = Combat._perform_attack(player, target, base_damage, "magic", silent=silent)
-                total_damage += damage_dealt
-                if defeated:
-                    if not silent:
-                        print(f"  ✓ {target.name} defeated!")
-                    player.monsters_killed += 1
-                    player.gain_bounty(1, silent=silent)
-                    enemies.remove(target)
+            total_damage += Combat._hit_all_enemies(player, enemies, base_damage, silent=silent)
 
         return total_damage, True
 
     @staticmethod
-    def _process_channeling_and_dots(player: Player, enemies: List[Enemy], silent: bool = False) -> None:
+    def _process_channeling_and_dots(player: Player, enemies: Deque[Enemy], silent: bool = False) -> None:
         """Process channeling spells and DoT effects at the start of player's turn."""
         # Process Beam channeling
         if player.channeling_spell and player.channeling_turns_remaining > 0:
@@ -1362,7 +1674,7 @@ class Combat:
                         print(f"  ✓ {target.name} defeated!")
                     player.monsters_killed += 1
                     player.gain_bounty(1, silent=silent)
-                    enemies.pop(0)
+                    enemies.popleft()
 
             # End channeling if done
             if player.channeling_turns_remaining == 0:
@@ -1380,14 +1692,7 @@ class Combat:
                 # Meteor strikes!
                 if not silent:
                     print(f"  💥 METEOR IMPACT! Hitting all enemies!")
-                for target in enemies[:]:  # Copy list
-                    defeated, damage_dealt, is_crit = Combat._perform_attack(player, target, player.meteor_damage, "magic", silent=silent)
-                    if defeated:
-                        if not silent:
-                            print(f"  ✓ {target.name} defeated!")
-                        player.monsters_killed += 1
-                        player.gain_bounty(1, silent=silent)
-                        enemies.remove(target)
+                Combat._hit_all_enemies(player, enemies, player.meteor_damage, silent=silent)
 
                 player.meteor_channeling = False
                 player.meteor_damage = 0
@@ -1407,7 +1712,7 @@ class Combat:
                         print(f"  ✓ {target.name} defeated!")
                     player.monsters_killed += 1
                     player.gain_bounty(1, silent=silent)
-                    enemies.pop(0)
+                    enemies.popleft()
 
             # Remove expired DoTs
             if dot["turns_remaining"] == 0:
@@ -1421,6 +1726,11 @@ class Combat:
         Execute combat between player and enemies.
         Returns True if player wins, False if player escaped.
         """
+        # Defeated enemies are always removed from the front, so use a deque
+        enemies = deque(enemies)
+        # Only mana users regenerate mana; defeated ones left in here are harmless
+        casters = [enemy for enemy in enemies if enemy.max_mana > 0]
+
         # Barrier: Initialize shield at battle start
         if player.has_barrier:
             new_shield = int(player.magic_attack * 0.5)
@@ -1438,14 +1748,17 @@ class Combat:
                     print(f"  🛡️ Barrier activates! Shield: {player.shield}")
 
         if not silent:
-            print(f"\n{'='*60}")
-            print(f"FLOOR {player.current_floor} - BATTLE START!")
-            print(f"{'='*60}")
+            # Build the whole header first and write it out in one go
             shield_str = f", Shield: {player.shield}" if player.shield > 0 else ""
-            print(f"{player.name}: {player.current_hp}/{player.max_hp} HP, {player.current_mana}/{player.max_mana} MP{shield_str}")
-            for i, enemy in enumerate(enemies, 1):
-                print(f"  Enemy {i}: {enemy}")
-            print()
+            header = [
+                f"\n{_SEP}",
+                f"FLOOR {player.current_floor} - BATTLE START!",
+                _SEP,
+                f"{player.name}: {player.current_hp}/{player.max_hp} HP, {player.current_mana}/{player.max_mana} MP{shield_str}",
+            ]
+            header.extend(f"  Enemy {i}: {enemy}" for i, enemy in enumerate(enemies, 1))
+            header.append("")
+            print("\n".join(header))
 
         turn = 0
         while enemies and player.is_alive:
@@ -1457,7 +1770,7 @@ class Combat:
             # Regenerate mana and health
             player.regenerate_mana()
             player.regenerate_health()
-            for enemy in enemies:
+            for enemy in casters:
                 enemy.regenerate_mana()
 
             # Arcane Battery: Auto-cast battery spell every 2 turns
@@ -1500,10 +1813,10 @@ class Combat:
             else:
                 player_speed = player.get_attack_speed()
                 num_attacks = int(player_speed)
-                has_partial_attack = (player_speed % 1) > 0
+                partial_attack = player_speed % 1
 
                 # If there's a fractional part, check if we get a bonus attack
-                if has_partial_attack and random.random() < (player_speed % 1):
+                if partial_attack > 0 and _random() < partial_attack:
                     num_attacks += 1
 
                 for attack_num in range(num_attacks):
@@ -1530,10 +1843,8 @@ class Combat:
                         if player.equipped_spell:
                             spell_to_cast = player.equipped_spell
                         elif player.can_cast_spells() and player.magic_attack > 0:
-                            # Create temporary Bolt spell as fallback
-                            spell_to_cast = Card("Bolt", CardType.SPELL, CardClass.SPELL,
-                                                "Fallback spell. Cost: 5 mana, Damage: 0.7x magic attack",
-                                                mana_cost=5, special_effect="bolt")
+                            # Use the shared Bolt spell as fallback
+                            spell_to_cast = _FALLBACK_BOLT
 
                         # Use spell if available and conditions are met
                         if spell_to_cast and player.magic_attack > 0:
@@ -1570,8 +1881,8 @@ class Combat:
                                         damage = player.magic_attack * 3
                                         attack_type = "magic"
                                         if not silent:
-                                            print(f"  🩸 Blood Magic! Using {hp_to_use} HP as mana!")
-                                            print(f"  ⚡ Mana Amplifier: Consuming mana for 3x magic damage!")
+                                            print(f"  🩸 Blood Magic! Using {hp_to_use} HP as mana!\n"
+                                                  f"  ⚡ Mana Amplifier: Consuming mana for 3x magic damage!")
                                     else:
                                         # Not enough HP+mana for Mana Amplifier, skip attack
                                         if not silent:
@@ -1595,7 +1906,9 @@ class Combat:
 
                             # Apply impale damage if the enemy survived the main hit
                             if impale_damage > 0 and not defeated:
-                                actual_impale_damage = max(1, impale_damage - target.defense)
+                                actual_impale_damage = impale_damage - target.defense
+                                if actual_impale_damage < 1:
+                                    actual_impale_damage = 1  # Always at least 1 damage
                                 target.current_hp -= actual_impale_damage
                                 player.total_damage_dealt += actual_impale_damage
                                 if not silent:
@@ -1626,7 +1939,9 @@ class Combat:
 
                             # Apply impale damage if the enemy survived the main hit
                             if impale_damage > 0 and not defeated:
-                                actual_impale_damage = max(1, impale_damage - target.defense)
+                                actual_impale_damage = impale_damage - target.defense
+                                if actual_impale_damage < 1:
+                                    actual_impale_damage = 1  # Always at least 1 damage
                                 target.current_hp -= actual_impale_damage
                                 player.total_damage_dealt += actual_impale_damage
                                 if not silent:
@@ -1648,7 +1963,7 @@ class Combat:
 
                             # Ogre's Sword: 10% chance to stun
                             if player.has_ogres_sword and not defeated:
-                                if random.random() < 0.10:
+                                if _random() < 0.10:
                                     target.stunned = True
                                     if not silent:
                                         print(f"  💫 Ogre's Sword: {target.name} is STUNNED! Will skip next turn")
@@ -1656,7 +1971,9 @@ class Combat:
                             # Spellblade: Add 50% of physical damage as magic damage
                             if player.has_spellblade and attack_type == "physical" and damage_dealt > 0 and not defeated:
                                 spellblade_damage = int(damage_dealt * 0.5)
-                                actual_spell_damage = max(1, spellblade_damage - target.defense)
+                                actual_spell_damage = spellblade_damage - target.defense
+                                if actual_spell_damage < 1:
+                                    actual_spell_damage = 1  # Always at least 1 damage
                                 target.current_hp -= actual_spell_damage
                                 player.total_damage_dealt += actual_spell_damage
                                 if not silent:
@@ -1675,8 +1992,8 @@ class Combat:
                 if player.has_ancestral_rage and attack_type == "physical" and damage_dealt > 0:
                     if player.ancestral_rage_stacks < 50:
                         player.ancestral_rage_stacks += 1
-                        speed_bonus = (player.ancestral_rage_stacks // 5) * 0.1
                         if not silent:
+                            speed_bonus = (player.ancestral_rage_stacks // 5) * 0.1
                             print(f"  ⚡ Ancestral Rage +1! (Stacks: {player.ancestral_rage_stacks}/50, +{player.ancestral_rage_stacks * 5} Attack, +{speed_bonus:.1f} Speed)")
 
                 if defeated:
@@ -1686,7 +2003,7 @@ class Combat:
                             print(f"  ✓ {target.name} defeated!")
                         player.monsters_killed += 1
                         player.gain_bounty(1, silent=silent)  # Gain 1 bounty per monster kill
-                        enemies.pop(0)
+                        enemies.popleft()
                     if not enemies:
                         if not silent:
                             print(f"\n🎉 {player.name} wins the battle!")
@@ -1694,7 +2011,7 @@ class Combat:
                         return True
 
             # Enemies turn
-            for enemy in enemies[:]:  # Copy list since we might remove enemies
+            for enemy in enemies:
                 # Check if enemy is stunned (skip turn)
                 if enemy.stunned:
                     if not silent:
@@ -1703,17 +2020,16 @@ class Combat:
                     continue
 
                 # Each enemy gets attacks based on their attack speed
-                num_attacks = int(enemy.attack_speed)
-                has_partial_attack = (enemy.attack_speed % 1) > 0
+                enemy_speed = enemy.attack_speed
+                num_attacks = int(enemy_speed)
+                partial_attack = enemy_speed % 1
 
-                if has_partial_attack and random.random() < (enemy.attack_speed % 1):
+                if partial_attack > 0 and _random() < partial_attack:
                     num_attacks += 1
 
                 for attack_num in range(num_attacks):
                     # Decide between physical and magic attack
-                    use_magic = (enemy.magic_attack > 0 and
-                               enemy.current_mana >= 20 and
-                               enemy.magic_attack > enemy.attack)
+                    use_magic = enemy.prefers_magic and enemy.current_mana >= 20
 
                     if use_magic:
                         damage = enemy.magic_attack
@@ -1726,8 +2042,8 @@ class Combat:
                     defeated, damage_dealt, _ = Combat._perform_attack(enemy, player, damage, attack_type, silent=silent)
                     if defeated:
                         if not silent:
-                            print(f"\n💀 {player.name} HP dropped to 1! AUTO-ESCAPE activated!")
-                            print(f"🏃 {player.name} escaped from floor {player.current_floor}.")
+                            print(f"\n💀 {player.name} HP dropped to 1! AUTO-ESCAPE activated!\n"
+                                  f"🏃 {player.name} escaped from floor {player.current_floor}.")
                         return False
 
             if not silent:
@@ -1736,306 +2052,166 @@ class Combat:
         return True
 
 
-def create_stat_card_pool() -> List[Card]:
+# Batch Simulation (balance tuning)
+def simulate_climb(deck: List[Card], ascension_slots: Optional[List[str]] = None,
+                   max_floor: int = Tower.MAX_FLOORS, tower: Optional[Tower] = None) -> int:
     """
-    Create a pool of stat cards with 4 levels each.
-    20 different stat types × 4 levels = 80 total cards.
+    Run one silent tower climb with the given deck, like the auto-battle in main().
+    Pass a tower to reuse its cached enemy stats across climbs.
+    Returns the floor the player reached (escaped on, or max_floor if cleared).
     """
-    cards = []
-
-    # Original 10 stat types - 4 levels each
-
-    # 1. Vitality (HP) - 4 levels
-    for level in range(1, 5):
-        hp_value = level * 20
-        cards.append(Card(
-            f"Vitality {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{hp_value} HP",
-            hp_bonus=hp_value
-        ))
-
-    # 2. Strength (Attack) - 4 levels
-    for level in range(1, 5):
-        atk_value = level * 5
-        cards.append(Card(
-            f"Strength {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{atk_value} Attack",
-            attack_bonus=atk_value
-        ))
-
-    # 3. Toughness (Defense) - 4 levels
-    for level in range(1, 5):
-        def_value = level * 4
-        cards.append(Card(
-            f"Toughness {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{def_value} Defense",
-            defense_bonus=def_value
-        ))
-
-    # 4. Intellect (Magic Attack) - 4 levels
-    for level in range(1, 5):
-        mag_value = level * 8
-        cards.append(Card(
-            f"Intellect {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{mag_value} Magic Attack",
-            magic_attack_bonus=mag_value
-        ))
-
-    # 5. Precision (Crit Chance) - 4 levels
-    for level in range(1, 5):
-        crit_value = level * 2.5
-        cards.append(Card(
-            f"Precision {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{crit_value}% Crit Chance",
-            crit_chance_bonus=crit_value
-        ))
-
-    # 6. Agility (Dodge) - 4 levels
-    for level in range(1, 5):
-        dodge_value = level * 3.0
-        cards.append(Card(
-            f"Agility {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{dodge_value}% Dodge Chance",
-            dodge_chance_bonus=dodge_value
-        ))
-
-    # 7. Wisdom (Mana) - 4 levels
-    for level in range(1, 5):
-        mana_value = level * 30
-        cards.append(Card(
-            f"Wisdom {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{mana_value} Mana",
-            mana_bonus=mana_value
-        ))
-
-    # 8. Meditation (Mana Regen) - 4 levels
-    for level in range(1, 5):
-        regen_value = level * 3
-        cards.append(Card(
-            f"Meditation {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{regen_value} Mana Regen",
-            mana_regen_bonus=regen_value
-        ))
-
-    # 9. Fortune (Luck) - 4 levels
-    for level in range(1, 5):
-        luck_value = level * 5
-        cards.append(Card(
-            f"Fortune {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{luck_value} Luck",
-            luck_bonus=luck_value
-        ))
-
-    # 10. Swiftness (Attack Speed) - 4 levels
-    for level in range(1, 5):
-        speed_value = level * 0.15
-        cards.append(Card(
-            f"Swiftness {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{speed_value:.2f} Attack Speed",
-            attack_speed_bonus=speed_value
-        ))
-
-    # NEW: 10 additional stat types - 4 levels each
-
-    # 11. Focus (Crit Damage) - 4 levels
-    for level in range(1, 5):
-        crit_dmg_value = level * 0.2
-        cards.append(Card(
-            f"Focus {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{int(crit_dmg_value*100)}% Crit Damage",
-            crit_damage_bonus=crit_dmg_value
-        ))
-
-    # 12. Endurance (HP + Defense combo) - 4 levels
-    for level in range(1, 5):
-        hp_value = level * 15
-        def_value = level * 3
-        cards.append(Card(
-            f"Endurance {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{hp_value} HP, +{def_value} Defense",
-            hp_bonus=hp_value,
-            defense_bonus=def_value
-        ))
-
-    # 13. Power (Attack + Crit Chance combo) - 4 levels
-    for level in range(1, 5):
-        atk_value = level * 3
-        crit_value = level * 2.0
-        cards.append(Card(
-            f"Power {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{atk_value} Attack, +{crit_value}% Crit Chance",
-            attack_bonus=atk_value,
-            crit_chance_bonus=crit_value
-        ))
-
-    # 14. Fury (Attack + Attack Speed combo) - 4 levels
-    for level in range(1, 5):
-        atk_value = level * 3
-        speed_value = level * 0.1
-        cards.append(Card(
-            f"Fury {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{atk_value} Attack, +{speed_value:.2f} Attack Speed",
-            attack_bonus=atk_value,
-            attack_speed_bonus=speed_value
-        ))
-
-    # 15. Spirit (Mana + Mana Regen combo) - 4 levels
-    for level in range(1, 5):
-        mana_value = level * 25
-        regen_value = level * 2
-        cards.append(Card(
-            f"Spirit {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{mana_value} Mana, +{regen_value} Mana Regen",
-            mana_bonus=mana_value,
-            mana_regen_bonus=regen_value
-        ))
-
-    # 16. Reflex (Dodge + Attack Speed combo) - 4 levels
-    for level in range(1, 5):
-        dodge_value = level * 2.5
-        speed_value = level * 0.1
-        cards.append(Card(
-            f"Reflex {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{dodge_value}% Dodge, +{speed_value:.2f} Attack Speed",
-            dodge_chance_bonus=dodge_value,
-            attack_speed_bonus=speed_value
-        ))
-
-    # 17. Arcane (Magic Attack + Mana combo) - 4 levels
-    for level in range(1, 5):
-        mag_value = level * 6
-        mana_value = level * 20
-        cards.append(Card(
-            f"Arcane {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{mag_value} Magic Attack, +{mana_value} Mana",
-            magic_attack_bonus=mag_value,
-            mana_bonus=mana_value
-        ))
-
-    # 18. Guardian (Defense + Dodge combo) - 4 levels
-    for level in range(1, 5):
-        def_value = level * 3
-        dodge_value = level * 2.0
-        cards.append(Card(
-            f"Guardian {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{def_value} Defense, +{dodge_value}% Dodge",
-            defense_bonus=def_value,
-            dodge_chance_bonus=dodge_value
-        ))
-
-    # 19. Warrior (HP + Attack combo) - 4 levels
-    for level in range(1, 5):
-        hp_value = level * 15
-        atk_value = level * 3
-        cards.append(Card(
-            f"Warrior {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{hp_value} HP, +{atk_value} Attack",
-            hp_bonus=hp_value,
-            attack_bonus=atk_value
-        ))
-
-    # 20. Assassin (Crit Chance + Crit Damage combo) - 4 levels
-    for level in range(1, 5):
-        crit_chance = level * 2.0
-        crit_dmg = level * 0.15
-        cards.append(Card(
-            f"Assassin {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{crit_chance}% Crit Chance, +{int(crit_dmg*100)}% Crit Damage",
-            crit_chance_bonus=crit_chance,
-            crit_damage_bonus=crit_dmg
-        ))
+    player = Player("Simulated")
+    if ascension_slots:
+        player.ascension_slots = list(ascension_slots)
+    player.equip_deck(list(deck))
 
-    # 21. Reckless (Attack Speed - Defense tradeoff) - 4 levels
-    for level in range(1, 5):
-        speed_value = level * 0.25
-        def_value = level * 6
-        cards.append(Card(
-            f"Reckless {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{speed_value:.2f} Attack Speed, -{def_value} Defense",
-            attack_speed_bonus=speed_value,
-            defense_bonus=-def_value
-        ))
+    if tower is None:
+        tower = Tower()
+    for floor in range(1, max_floor + 1):
+        player.current_floor = floor
+        if not Combat.battle(player, tower.generate_enemies(floor), silent=True):
+            break
+        player.reset_for_floor()
 
-    # 22. Tank (HP - Dodge tradeoff) - 4 levels
-    for level in range(1, 5):
-        hp_value = level * 50
-        dodge_value = level * 5.0
-        cards.append(Card(
-            f"Tank {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{hp_value} HP, -{dodge_value}% Dodge Chance",
-            hp_bonus=hp_value,
-            dodge_chance_bonus=-dodge_value
-        ))
+    return player.current_floor
 
-    # 23. Capacitor (Mana Regen - Mana tradeoff) - 4 levels
-    for level in range(1, 5):
-        regen_value = level * 5
-        mana_value = level * 15
-        cards.append(Card(
-            f"Capacitor {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{regen_value} Mana Regen, -{mana_value} Mana",
-            mana_regen_bonus=regen_value,
-            mana_bonus=-mana_value
-        ))
 
-    # 24. Pinpoint (Crit Chance - Attack/Magic Attack tradeoff) - 4 levels
-    for level in range(1, 5):
-        crit_value = level * 7.5
-        atk_value = level * 10
-        cards.append(Card(
-            f"Pinpoint {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{crit_value}% Crit Chance, -{atk_value} Attack, -{atk_value} Magic Attack",
-            crit_chance_bonus=crit_value,
-            attack_bonus=-atk_value,
-            magic_attack_bonus=-atk_value
-        ))
+def _simulate_climbs(deck: List[Card], runs: int, ascension_slots: Optional[List[str]],
+                     max_floor: int, seeds: Optional[List[int]] = None) -> List[int]:
+    """
+    Run several climbs in a row, sharing one Tower (and its enemy stats cache).
+    If seeds are given, the RNG is reseeded before each climb so it plays out
+    the same in any worker.
+    """
+    tower = Tower()
+    if seeds is None:
+        return [simulate_climb(deck, ascension_slots, max_floor, tower) for _ in range(runs)]
+    floors = []
+    for seed in seeds:
+        random.seed(seed)
+        floors.append(simulate_climb(deck, ascension_slots, max_floor, tower))
+    return floors
+
+
+def simulate_runs(deck: List[Card], runs: int, ascension_slots: Optional[List[str]] = None,
+                  max_floor: int = Tower.MAX_FLOORS, workers: Optional[int] = None,
+                  seed: Optional[int] = None) -> List[int]:
+    """
+    Run many independent climbs with the same deck across worker processes.
+    Each worker reseeds its RNG so runs don't repeat each other. With a single
+    worker or a single run, the climbs run in this process instead.
 
-    # 25. Fatal Hits (Crit Damage - Crit Chance tradeoff) - 4 levels
-    for level in range(1, 5):
-        crit_dmg_value = level * 0.5
-        crit_chance_value = level * 5.0
-        cards.append(Card(
-            f"Fatal Hits {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{int(crit_dmg_value*100)}% Crit Damage, -{crit_chance_value}% Crit Chance",
-            crit_damage_bonus=crit_dmg_value,
-            crit_chance_bonus=-crit_chance_value
-        ))
+    Args:
+        seed: If given, every run gets its own seed drawn from it, so the
+              results are reproducible for any number of workers
 
-    # 26. Regeneration (Health Regen) - 4 levels
-    for level in range(1, 5):
-        regen_value = level * 2
-        cards.append(Card(
-            f"Regeneration {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{regen_value} Health Regen",
-            health_regen_bonus=regen_value
-        ))
+    Returns:
+        The floor reached in each run
+    """
+    workers = workers or os.cpu_count() or 1
+    run_seeds = None
+    if seed is not None:
+        seeder = random.Random(seed)
+        run_seeds = [seeder.getrandbits(64) for _ in range(runs)]
+
+    if workers <= 1 or runs <= 1:
+        # Not worth starting worker processes
+        if run_seeds is None:
+            return _simulate_climbs(deck, runs, ascension_slots, max_floor)
+        # Seeded climbs reseed the shared RNG, so put the caller's state back afterwards
+        rng_state = random.getstate()
+        try:
+            return _simulate_climbs(deck, runs, ascension_slots, max_floor, run_seeds)
+        finally:
+            random.setstate(rng_state)
+
+    # Hand each worker batches of climbs rather than single ones
+    batch_size = max(1, runs // (4 * workers))
+    batches = [min(batch_size, runs - start) for start in range(0, runs, batch_size)]
+    if run_seeds is None:
+        batch_seeds = itertools.repeat(None, len(batches))
+    else:
+        batch_seeds = [run_seeds[start:start + batch_size] for start in range(0, runs, batch_size)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=random.seed) as executor:
+        results = executor.map(
+            _simulate_climbs,
+            itertools.repeat(deck, len(batches)),
+            batches,
+            itertools.repeat(ascension_slots, len(batches)),
+            itertools.repeat(max_floor, len(batches)),
+            batch_seeds,
+        )
+        return list(itertools.chain.from_iterable(results))
+
+
+# Stat cards, 4 levels each: (name, description format, ((bonus field, value per level), ...)).
+# The description gets each value's size (the sign is in the format); crit damage is shown
+# as a whole percent.
+_STAT_CARD_SPECS = (
+    # Original 10 stat types
+    ("Vitality", "+{0} HP", (("hp_bonus", 20),)),
+    ("Strength", "+{0} Attack", (("attack_bonus", 5),)),
+    ("Toughness", "+{0} Defense", (("defense_bonus", 4),)),
+    ("Intellect", "+{0} Magic Attack", (("magic_attack_bonus", 8),)),
+    ("Precision", "+{0}% Crit Chance", (("crit_chance_bonus", 2.5),)),
+    ("Agility", "+{0}% Dodge Chance", (("dodge_chance_bonus", 3.0),)),
+    ("Wisdom", "+{0} Mana", (("mana_bonus", 30),)),
+    ("Meditation", "+{0} Mana Regen", (("mana_regen_bonus", 3),)),
+    ("Fortune", "+{0} Luck", (("luck_bonus", 5),)),
+    ("Swiftness", "+{0:.2f} Attack Speed", (("attack_speed_bonus", 0.15),)),
+    # 10 additional stat types
+    ("Focus", "+{0}% Crit Damage", (("crit_damage_bonus", 0.2),)),
+    ("Endurance", "+{0} HP, +{1} Defense", (("hp_bonus", 15), ("defense_bonus", 3))),
+    ("Power", "+{0} Attack, +{1}% Crit Chance", (("attack_bonus", 3), ("crit_chance_bonus", 2.0))),
+    ("Fury", "+{0} Attack, +{1:.2f} Attack Speed", (("attack_bonus", 3), ("attack_speed_bonus", 0.1))),
+    ("Spirit", "+{0} Mana, +{1} Mana Regen", (("mana_bonus", 25), ("mana_regen_bonus", 2))),
+    ("Reflex", "+{0}% Dodge, +{1:.2f} Attack Speed", (("dodge_chance_bonus", 2.5), ("attack_speed_bonus", 0.1))),
+    ("Arcane", "+{0} Magic Attack, +{1} Mana", (("magic_attack_bonus", 6), ("mana_bonus", 20))),
+    ("Guardian", "+{0} Defense, +{1}% Dodge", (("defense_bonus", 3), ("dodge_chance_bonus", 2.0))),
+    ("Warrior", "+{0} HP, +{1} Attack", (("hp_bonus", 15), ("attack_bonus", 3))),
+    ("Assassin", "+{0}% Crit Chance, +{1}% Crit Damage", (("crit_chance_bonus", 2.0), ("crit_damage_bonus", 0.15))),
+    # Tradeoffs
+    ("Reckless", "+{0:.2f} Attack Speed, -{1} Defense", (("attack_speed_bonus", 0.25), ("defense_bonus", -6))),
+    ("Tank", "+{0} HP, -{1}% Dodge Chance", (("hp_bonus", 50), ("dodge_chance_bonus", -5.0))),
+    ("Capacitor", "+{0} Mana Regen, -{1} Mana", (("mana_regen_bonus", 5), ("mana_bonus", -15))),
+    ("Pinpoint", "+{0}% Crit Chance, -{1} Attack, -{2} Magic Attack",
+     (("crit_chance_bonus", 7.5), ("attack_bonus", -10), ("magic_attack_bonus", -10))),
+    ("Fatal Hits", "+{0}% Crit Damage, -{1}% Crit Chance", (("crit_damage_bonus", 0.5), ("crit_chance_bonus", -5.0))),
+    # Health regen
+    ("Regeneration", "+{0} Health Regen", (("health_regen_bonus", 2),)),
+    ("Resilience", "+{0} HP, +{1} Health Regen", (("hp_bonus", 15), ("health_regen_bonus", 1))),
+    ("Vampirism", "+{0} Health Regen, -{1} Defense", (("health_regen_bonus", 3), ("defense_bonus", -3))),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_stat_card_pool() -> Tuple[Card, ...]:
+    """
+    Create a pool of stat cards with 4 levels each, from _STAT_CARD_SPECS.
+    28 different stat types × 4 levels = 112 total cards.
+    """
+    cards = []
+    for name, description, bonuses in _STAT_CARD_SPECS:
+        for level in range(1, 5):
+            values = {field: level * per_level for field, per_level in bonuses}
+            shown = [int(value * 100) if field == "crit_damage_bonus" else abs(value)
+                     for field, value in values.items()]
+            cards.append(Card(
+                f"{name} {level}", CardType.PASSIVE, CardClass.STAT,
+                description.format(*shown),
+                **values
+            ))
 
-    # 27. Resilience (HP + Health Regen combo) - 4 levels
-    for level in range(1, 5):
-        hp_value = level * 15
-        regen_value = level * 1
-        cards.append(Card(
-            f"Resilience {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{hp_value} HP, +{regen_value} Health Regen",
-            hp_bonus=hp_value,
-            health_regen_bonus=regen_value
-        ))
+    return tuple(cards)
 
-    # 28. Vampirism (Health Regen - Defense tradeoff) - 4 levels
-    for level in range(1, 5):
-        regen_value = level * 3
-        def_value = level * 3
-        cards.append(Card(
-            f"Vampirism {level}", CardType.PASSIVE, CardClass.STAT,
-            f"+{regen_value} Health Regen, -{def_value} Defense",
-            health_regen_bonus=regen_value,
-            defense_bonus=-def_value
-        ))
 
-    return cards
+def create_stat_card_pool() -> List[Card]:
+    """Return the stat card pool as a new list (the cards are built once and shared)."""
+    return list(_build_stat_card_pool())
 
 
-def create_equipment_card_pool() -> List[Card]:
+@functools.lru_cache(maxsize=1)
+def _build_equipment_card_pool() -> Tuple[Card, ...]:
     """
     Create a pool of 21 equipment cards.
     These provide base attack or defense stats.
@@ -2172,10 +2348,16 @@ def create_equipment_card_pool() -> List[Card]:
         accessory_type=AccessoryType.AMULET
     ))
 
-    return cards
+    return tuple(cards)
 
 
-def create_spell_card_pool() -> List[Card]:
+def create_equipment_card_pool() -> List[Card]:
+    """Return the equipment card pool as a new list (the cards are built once and shared)."""
+    return list(_build_equipment_card_pool())
+
+
+@functools.lru_cache(maxsize=1)
+def _build_spell_card_pool() -> Tuple[Card, ...]:
     """
     Create a pool of spell cards with various mechanics.
     Spells can only be cast when wielding a magic weapon (Wand, Staff, or Tome).
@@ -2331,10 +2513,16 @@ def create_spell_card_pool() -> List[Card]:
         special_effect="thunderbolt"
     ))
 
-    return cards
+    return tuple(cards)
 
 
-def create_unique_card_pool() -> List[Card]:
+def create_spell_card_pool() -> List[Card]:
+    """Return the spell card pool as a new list (the cards are built once and shared)."""
+    return list(_build_spell_card_pool())
+
+
+@functools.lru_cache(maxsize=1)
+def _build_unique_card_pool() -> Tuple[Card, ...]:
     """
     Create a pool of unique cards with special mechanics.
     These are rare pulls from specific packs.
@@ -2496,14 +2684,21 @@ def create_unique_card_pool() -> List[Card]:
         special_effect="ogres_sword"
     ))
 
-    return cards
+    return tuple(cards)
+
 
+def create_unique_card_pool() -> List[Card]:
+    """Return the unique card pool as a new list (the cards are built once and shared)."""
+    return list(_build_unique_card_pool())
 
+
+@functools.lru_cache(maxsize=1)
 def create_card_packs() -> dict:
     """
     Create card packs for the pack-based selection system.
     Returns a dictionary where keys are pack names and values are lists of cards.
     Each pack has common cards and unique (rare) cards.
+    The packs are built once and shared between callers, so treat them as read-only.
     """
     stat_pool = create_stat_card_pool()
     equipment_pool = create_equipment_card_pool()
@@ -2536,20 +2731,20 @@ def create_card_packs() -> dict:
     # Physical Weapons Pack - all physical weapons + Titan's Strength, Impaler, Ogre's Sword (unique)
     packs["Physical Weapons"] = {
         "common": [card for card in equipment_pool
-                   if card.card_type == CardType.WEAPON and card.attack_bonus > 0],
+                   if card.card_type is CardType.WEAPON and card.attack_bonus > 0],
         "unique": [unique_cards["titans_strength"], unique_cards["impaler_weapon"], unique_cards["ogres_sword"]]
     }
 
     # Magic Weapons Pack - all magic weapons + Arcane Tome Wielder, Arcane Battery (unique)
     packs["Magic Weapons"] = {
         "common": [card for card in equipment_pool
-                   if card.card_type == CardType.WEAPON and card.magic_attack_bonus > 0],
+                   if card.card_type is CardType.WEAPON and card.magic_attack_bonus > 0],
         "unique": [unique_cards["arcane_tome_wielder"], unique_cards["arcane_battery"]]
     }
 
     # Armor Pack - all armor (no unique)
     packs["Armor"] = {
-        "common": [card for card in equipment_pool if card.card_type == CardType.ARMOR],
+        "common": [card for card in equipment_pool if card.card_type is CardType.ARMOR],
         "unique": []
     }
 
@@ -2654,43 +2849,48 @@ def get_compatible_weapon_types(equipped_weapons: List[Card]) -> List[WeaponType
         # Quiver requires a bow to be equipped first
         return None  # None means we'll filter quivers separately
 
-    # Get weapon types of currently equipped weapons
-    weapon_types = [w.weapon_type for w in equipped_weapons if w.weapon_type]
+    # Order matters (the first weapon decides the pairing), so key on a tuple
+    weapon_types = tuple(w.weapon_type for w in equipped_weapons if w.weapon_type)
+    return list(_compatible_weapon_types_for(weapon_types))
+
 
+@functools.lru_cache(maxsize=256)
+def _compatible_weapon_types_for(weapon_types: Tuple[WeaponType, ...]) -> Tuple[WeaponType, ...]:
+    """Cached lookup of the weapon types allowed after the given equipped types."""
     # If already have 2 weapons, no more weapons allowed
     if len(weapon_types) >= 2:
-        return []
+        return ()
 
     # If have 1 weapon, determine what can be equipped next
     first_weapon_type = weapon_types[0]
 
     # Sword → can draw another Sword or Shield
-    if first_weapon_type == WeaponType.SWORD:
-        return [WeaponType.SWORD, WeaponType.SHIELD]
+    if first_weapon_type is WeaponType.SWORD:
+        return (WeaponType.SWORD, WeaponType.SHIELD)
 
     # Bow → can draw Quiver or Dagger
-    elif first_weapon_type == WeaponType.BOW:
-        return [WeaponType.QUIVER, WeaponType.DAGGER]
+    elif first_weapon_type is WeaponType.BOW:
+        return (WeaponType.QUIVER, WeaponType.DAGGER)
 
     # Wand → can draw another Wand
-    elif first_weapon_type == WeaponType.WAND:
-        return [WeaponType.WAND]
+    elif first_weapon_type is WeaponType.WAND:
+        return (WeaponType.WAND,)
 
     # Dagger → can draw Bow only if it's the first weapon slot
-    elif first_weapon_type == WeaponType.DAGGER:
-        return [WeaponType.BOW]
+    elif first_weapon_type is WeaponType.DAGGER:
+        return (WeaponType.BOW,)
 
     # Shield → can be paired with swords or other one-handed weapons
-    elif first_weapon_type == WeaponType.SHIELD:
-        return [WeaponType.SWORD, WeaponType.AXE, WeaponType.SPEAR]
+    elif first_weapon_type is WeaponType.SHIELD:
+        return (WeaponType.SWORD, WeaponType.AXE, WeaponType.SPEAR)
 
     # Quiver → needs a bow (shouldn't happen as quiver should be second)
-    elif first_weapon_type == WeaponType.QUIVER:
-        return [WeaponType.BOW]
+    elif first_weapon_type is WeaponType.QUIVER:
+        return (WeaponType.BOW,)
 
     # Two-handed weapons (Greatsword, Axe, Spear, Staff, Tome, Bow) → no more weapons
     else:
-        return []
+        return ()
 
 
 def can_equip_weapon(card: Card, equipped_weapons: List[Card]) -> bool:
@@ -2704,21 +2904,47 @@ def can_equip_weapon(card: Card, equipped_weapons: List[Card]) -> bool:
     Returns:
         True if the weapon can be equipped, False otherwise
     """
-    if card.card_type != CardType.WEAPON:
+    if card.card_type is not CardType.WEAPON:
         return True  # Non-weapons can always be added
 
-    compatible_types = get_compatible_weapon_types(equipped_weapons)
-
-    # If None, all weapons allowed (first weapon)
-    if compatible_types is None:
+    # No weapons equipped yet, all weapons allowed (first weapon)
+    if not equipped_weapons:
         return True
 
-    # If empty list, no more weapons allowed
-    if not compatible_types:
-        return False
+    # Check against the cached compatible tuple directly (empty tuple = no more weapons)
+    weapon_types = tuple(w.weapon_type for w in equipped_weapons if w.weapon_type)
+    return card.weapon_type in _compatible_weapon_types_for(weapon_types)
 
-    # Check if this weapon type is in the compatible list
-    return card.weapon_type in compatible_types
+
+def _weapon_filtered_cards(pack_data: dict, compatible_weapon_types: Optional[List[WeaponType]],
+                           is_weapon_pack: bool) -> Tuple[List[Card], List[Card]]:
+    """Return the pack's (common, unique) cards after weapon compatibility filtering."""
+    common_cards = pack_data["common"]
+    unique_cards = pack_data["unique"]
+
+    # The result only depends on the allowed weapon types, so filtered lists
+    # are memoized on the pack itself
+    if is_weapon_pack:
+        filter_key = tuple(compatible_weapon_types) if compatible_weapon_types is not None else None
+        filtered_cache = pack_data.setdefault("_weapon_filtered", {})
+        filtered = filtered_cache.get(filter_key)
+        if filtered is None:
+            if compatible_weapon_types is not None:
+                # Keep non-weapons and compatible weapons
+                def weapon_allowed(card: Card) -> bool:
+                    return card.card_type is not CardType.WEAPON or card.weapon_type in compatible_weapon_types
+            else:
+                # Weapon pack, but no weapons equipped yet
+                # Allow all weapon types EXCEPT quiver (quiver requires bow first)
+                def weapon_allowed(card: Card) -> bool:
+                    return card.card_type is not CardType.WEAPON or card.weapon_type is not WeaponType.QUIVER
+            filtered = filtered_cache[filter_key] = (
+                [card for card in common_cards if weapon_allowed(card)],
+                [card for card in unique_cards if weapon_allowed(card)],
+            )
+        common_cards, unique_cards = filtered
+
+    return common_cards, unique_cards
 
 
 def open_pack(pack_data: dict, player: Optional['Player'] = None, compatible_weapon_types: Optional[List[WeaponType]] = None, is_weapon_pack: bool = False) -> Card:
@@ -2727,7 +2953,8 @@ def open_pack(pack_data: dict, player: Optional['Player'] = None, compatible_wea
     Unique cards have a 5% drop rate.
 
     Args:
-        pack_data: Dictionary with 'common' and 'unique' card lists
+        pack_data: Dictionary with 'common' and 'unique' card lists (weapon-filtered
+                   lists are cached under '_weapon_filtered')
         player: Optional player to check spawn conditions against
         compatible_weapon_types: Optional list of compatible weapon types to filter by (None = no filter)
         is_weapon_pack: Whether this is a weapon pack (applies quiver restrictions)
@@ -2735,51 +2962,60 @@ def open_pack(pack_data: dict, player: Optional['Player'] = None, compatible_wea
     Returns:
         A random card from the pack
     """
-    common_cards = pack_data["common"]
-    unique_cards = pack_data["unique"]
+    common_cards, unique_cards = _weapon_filtered_cards(pack_data, compatible_weapon_types, is_weapon_pack)
 
-    # Filter cards based on weapon compatibility if specified
-    if is_weapon_pack and compatible_weapon_types is not None:
-        # Filter common cards - keep non-weapons and compatible weapons
-        common_cards = [
-            card for card in common_cards
-            if card.card_type != CardType.WEAPON or card.weapon_type in compatible_weapon_types
-        ]
-        # Filter unique cards - keep non-weapons and compatible weapons
-        unique_cards = [
-            card for card in unique_cards
-            if card.card_type != CardType.WEAPON or card.weapon_type in compatible_weapon_types
-        ]
-    elif is_weapon_pack and compatible_weapon_types is None:
-        # Weapon pack, but no weapons equipped yet
-        # Allow all weapon types EXCEPT quiver (quiver requires bow first)
-        common_cards = [
-            card for card in common_cards
-            if card.card_type != CardType.WEAPON or card.weapon_type != WeaponType.QUIVER
-        ]
-        unique_cards = [
-            card for card in unique_cards
-            if card.card_type != CardType.WEAPON or card.weapon_type != WeaponType.QUIVER
-        ]
-
-    # Filter unique cards based on spawn conditions
-    if player:
-        unique_cards = [card for card in unique_cards if check_spawn_condition(card, player)]
+    # Unique cards additionally have to pass spawn conditions
+    def unique_allowed(card: Card) -> bool:
+        return not player or check_spawn_condition(card, player)
+
+    # Only check whether any unique qualifies; the full list is built lazily
+    # because the 5% roll below rarely needs it
+    has_unique = any(unique_allowed(card) for card in unique_cards)
 
     # If no cards left after filtering, return None (shouldn't happen with proper pack blocking)
-    if not common_cards and not unique_cards:
+    if not common_cards and not has_unique:
         return None
 
     # 5% chance to get a unique card (if any exist in this pack and pass spawn conditions)
-    if unique_cards and random.random() < 0.05:
-        return random.choice(unique_cards)
+    if has_unique and random.random() < 0.05:
+        return random.choice([card for card in unique_cards if unique_allowed(card)])
 
     # Otherwise, get a common card
     if common_cards:
         return random.choice(common_cards)
 
     # Fallback to unique if no common cards available
-    return random.choice(unique_cards) if unique_cards else None
+    return random.choice([card for card in unique_cards if unique_allowed(card)])
+
+
+def open_pack_batch(pack_data: dict, count: int, player: Optional['Player'] = None,
+                    compatible_weapon_types: Optional[List[WeaponType]] = None,
+                    is_weapon_pack: bool = False) -> List[Card]:
+    """
+    Open the same pack `count` times with one round of filtering.
+    Each draw follows the same odds as open_pack (5% unique chance).
+
+    Returns:
+        List of drawn cards (empty if the pack has no eligible cards)
+    """
+    common_cards, unique_cards = _weapon_filtered_cards(pack_data, compatible_weapon_types, is_weapon_pack)
+    if player:
+        unique_cards = [card for card in unique_cards if check_spawn_condition(card, player)]
+
+    if not common_cards and not unique_cards:
+        return []
+
+    roll = random.random
+    choice = random.choice
+    draws = []
+    for _ in range(count):
+        if unique_cards and roll() < 0.05:
+            draws.append(choice(unique_cards))
+        elif common_cards:
+            draws.append(choice(common_cards))
+        else:
+            draws.append(choice(unique_cards))
+    return draws
 
 
 def print_battle_report(players: List[Player]):
@@ -2787,13 +3023,13 @@ def print_battle_report(players: List[Player]):
     Print a detailed battle report for all players.
     Shows floors reached, monsters killed, damage dealt/taken, etc.
     """
-    print("\n" + "="*80)
+    print("\n" + _WIDE_SEP)
     print("BATTLE REPORT - AUTO-SIMULATION COMPLETE")
-    print("="*80)
+    print(_WIDE_SEP)
     print()
 
     # Sort players by floors reached (descending)
-    sorted_players = sorted(players, key=lambda p: p.current_floor, reverse=True)
+    sorted_players = sorted(players, key=operator.attrgetter("current_floor"), reverse=True)
 
     # Print summary table
     print("FINAL STANDINGS:")
@@ -2810,7 +3046,7 @@ def print_battle_report(players: List[Player]):
 
     # Detailed stats for each player
     print("DETAILED STATISTICS:")
-    print("="*80)
+    print(_WIDE_SEP)
 
     for player in sorted_players:
         # Calculate pack breakdown
@@ -2853,7 +3089,7 @@ def print_battle_report(players: List[Player]):
             print(f"  Avg Turns/Floor:    {avg_turns_per_floor:.1f}")
             print(f"  Avg Monsters/Floor: {avg_monsters_per_floor:.1f}")
 
-    print("\n" + "="*80)
+    print("\n" + _WIDE_SEP)
 
 
 def select_packs_interactive(player: Player) -> List[Card]:
@@ -2877,9 +3113,9 @@ def select_packs_interactive(player: Player) -> List[Card]:
     pack_names = list(packs.keys())
     selected_cards = []
 
-    print("\n" + "="*60)
+    print("\n" + _SEP)
     print("PACK SELECTION")
-    print("="*60)
+    print(_SEP)
     print(f"Level {level}: Select {num_packs} packs to open. Each pack gives you 1 random card!")
     if player.packs_remaining > 0:
         print(f"  (Base: {base_packs} packs + {player.packs_remaining} remaining from last time)")
@@ -2922,7 +3158,7 @@ def select_packs_interactive(player: Player) -> List[Card]:
                     pack_name = pack_names[idx]
 
                     # Get currently equipped weapons
-                    equipped_weapons = [c for c in selected_cards if c.card_type == CardType.WEAPON]
+                    equipped_weapons = [c for c in selected_cards if c.card_type is CardType.WEAPON]
 
                     # Check if this is a weapon pack and we already have 2 weapons
                     is_weapon_pack = pack_name in ["Physical Weapons", "Magic Weapons"]
@@ -2948,7 +3184,7 @@ def select_packs_interactive(player: Player) -> List[Card]:
                         continue
 
                     # Show the card drawn
-                    unique_marker = " ✨ UNIQUE!" if card.card_class == CardClass.UNIQUE else ""
+                    unique_marker = " ✨ UNIQUE!" if card.card_class is CardClass.UNIQUE else ""
                     print(f"✓ Opened {pack_name}! Got: {card.name}{unique_marker}")
                     print(f"   {card.description}")
 
@@ -2961,7 +3197,7 @@ def select_packs_interactive(player: Player) -> List[Card]:
                             if card is None:
                                 print(f"   ⚠️  No compatible cards available in this pack.")
                                 break
-                            unique_marker = " ✨ UNIQUE!" if card.card_class == CardClass.UNIQUE else ""
+                            unique_marker = " ✨ UNIQUE!" if card.card_class is CardClass.UNIQUE else ""
                             print(f"🔄 Rerolled! Got: {card.name}{unique_marker}")
                             print(f"   {card.description}")
                         elif reroll_choice == 'n':
@@ -2994,12 +3230,12 @@ def select_packs_interactive(player: Player) -> List[Card]:
     # All packs opened - clear remaining counter
     player.packs_remaining = 0
 
-    print("\n" + "="*60)
+    print("\n" + _SEP)
     print(f"FINAL DECK ({len(selected_cards)} cards)")
     print(f"Remaining Bounty: {player.bounty} 💰")
-    print("="*60)
+    print(_SEP)
     for card in selected_cards:
-        weapon_marker = f" ({card.weapon_type.value})" if card.card_type == CardType.WEAPON and card.weapon_type else ""
+        weapon_marker = f" ({card.weapon_type.value})" if card.card_type is CardType.WEAPON and card.weapon_type else ""
         print(f"  - {card.name}{weapon_marker}")
 
     return selected_cards
@@ -3027,9 +3263,9 @@ def select_ascension_card_interactive(player: Player, slot_number: int) -> str:
     ascension_cards = get_ascension_cards()
     card_names = list(ascension_cards.keys())
 
-    print("\n" + "="*60)
+    print("\n" + _SEP)
     print(f"ASCENSION CARD SELECTION - SLOT {slot_number}")
-    print("="*60)
+    print(_SEP)
     print(f"Level {player.level}: Choose your ascension card!")
     print("\nAvailable Ascension Cards:")
     print()
@@ -3065,9 +3301,9 @@ def change_ascension_card_interactive(player: Player) -> bool:
     card_names = list(ascension_cards.keys())
     changes_made = False
 
-    print("\n" + "="*60)
+    print("\n" + _SEP)
     print("CHANGE ASCENSION CARDS")
-    print("="*60)
+    print(_SEP)
     print(f"Current Bounty: {player.bounty} 💰")
     print(f"Cost to change: 100 bounty per slot")
     print()
@@ -3150,12 +3386,12 @@ def create_bounty_shop_inventory() -> List[Tuple[Card, int]]:
     unique_pool = create_unique_card_pool()
 
     # Weapons: 10 bounty each (at least 3)
-    weapons = [card for card in equipment_pool if card.card_type == CardType.WEAPON]
+    weapons = [card for card in equipment_pool if card.card_type is CardType.WEAPON]
     for weapon in weapons:
         inventory.append((weapon, 10))
 
     # Armor: 20 bounty each
-    armors = [card for card in equipment_pool if card.card_type == CardType.ARMOR]
+    armors = [card for card in equipment_pool if card.card_type is CardType.ARMOR]
     for armor in armors[:3]:  # Add 3 armors
         inventory.append((armor, 20))
 
@@ -3189,9 +3425,9 @@ def bounty_shop_interactive(player: Player) -> List[Card]:
     inventory = create_bounty_shop_inventory()
     purchased_cards = []
 
-    print("\n" + "="*60)
+    print("\n" + _SEP)
     print("💰 BOUNTY SHOP 💰")
-    print("="*60)
+    print(_SEP)
     print(f"Welcome, {player.name}!")
     print(f"Your Bounty: {player.bounty}")
     print("\nCards bought here are ONLY for the next tower run!")
@@ -3199,17 +3435,17 @@ def bounty_shop_interactive(player: Player) -> List[Card]:
     print()
 
     while True:
-        print("\n" + "-"*60)
+        print("\n" + _THIN_SEP)
         print("SHOP INVENTORY:")
-        print("-"*60)
+        print(_THIN_SEP)
         print(f"{'#':<4} {'Card':<30} {'Type':<12} {'Price':<8}")
-        print("-"*60)
+        print(_THIN_SEP)
 
         for i, (card, price) in enumerate(inventory, 1):
-            unique_marker = " ✨" if card.card_class == CardClass.UNIQUE else ""
+            unique_marker = " ✨" if card.card_class is CardClass.UNIQUE else ""
             print(f"{i:<4} {card.name:<30} {card.card_type.value:<12} {price} 💰{unique_marker}")
 
-        print("-"*60)
+        print(_THIN_SEP)
         print(f"Your Bounty: {player.bounty} 💰")
         print(f"Purchased so far: {len(purchased_cards)} cards")
         print()
@@ -3240,11 +3476,11 @@ def bounty_shop_interactive(player: Player) -> List[Card]:
         except ValueError:
             print("Invalid input. Enter a number or 'done'.")
 
-    print("\n" + "="*60)
+    print("\n" + _SEP)
     print(f"PURCHASE COMPLETE")
     print(f"Remaining Bounty: {player.bounty} 💰")
     print(f"Purchased {len(purchased_cards)} cards for next run")
-    print("="*60)
+    print(_SEP)
 
     if purchased_cards:
         print("\nPurchased cards:")
@@ -3263,21 +3499,21 @@ def prep_menu(player: Player, all_players: List['Player']) -> List[Card]:
     all_cards = []
 
     while True:
-        print(f"\n{'='*60}")
+        print(f"\n{_SEP}")
         print(f"{player.name.upper()}'S PREPARATION MENU - DAY {player.day}")
-        print(f"{'='*60}")
+        print(_SEP)
         print(f"Level: {player.level}")
         print(f"Bounty: {player.bounty} 💰")
         print(f"Highest Floor: {player.highest_floor}")
         print(f"Cards collected this session: {len(all_cards)}")
-        print(f"\n{'='*60}")
+        print(f"\n{_SEP}")
         print("What would you like to do?")
-        print(f"{'='*60}")
+        print(_SEP)
         print("  1. Visit Bounty Shop")
         print("  2. Select and Open Packs")
         print("  3. Save Game")
         print("  4. Enter Tower (end preparation)")
-        print(f"{'='*60}")
+        print(_SEP)
 
         choice = input("\nEnter choice (1-4): ").strip()
 
@@ -3293,11 +3529,8 @@ def prep_menu(player: Player, all_players: List['Player']) -> List[Card]:
 
         elif choice == '3':
             # Save game
-            # Temporarily update the deck with collected cards before saving
-            old_deck = player.deck.copy() if player.deck else []
-            player.deck = all_cards
-            save_game(all_players, "save_game.json")
-            player.deck = old_deck  # Restore old deck (will be properly equipped later)
+            # Save the collected cards as this player's deck (they are equipped later)
+            save_game(all_players, "save_game.json", deck_overrides={player: all_cards})
             print("\n✓ Game saved successfully!")
 
         elif choice == '4':
@@ -3312,16 +3545,16 @@ def prep_menu(player: Player, all_players: List['Player']) -> List[Card]:
 
 def main():
     """Main game loop."""
-    print("="*60)
+    print(_SEP)
     print("TOWER CLIMBING ROGUELIKE")
     print("Climb the 1000-floor tower and compete for the highest floor!")
-    print("="*60)
+    print(_SEP)
     print()
 
     # Phase 1: Load saved game or create new players
-    print("\n" + "="*60)
+    print("\n" + _SEP)
     print("PLAYER SETUP")
-    print("="*60)
+    print(_SEP)
 
     load_choice = input("\nLoad saved game? [y/n]: ").strip().lower()
 
@@ -3352,16 +3585,16 @@ def main():
     # Main game loop - repeat prep and tower phases indefinitely
     while True:
         # Phase 2: Each player does their prep in turns via menu
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("PREPARATION PHASE")
-        print("="*60)
+        print(_SEP)
         print("Each player will take turns preparing for the tower.")
         print("When you're ready to enter, choose 'Enter Tower' to pass to the next player.")
 
         for i, player in enumerate(players, 1):
-            print(f"\n{'='*60}")
+            print(f"\n{_SEP}")
             print(f"PLAYER {i}/{len(players)}: {player.name.upper()}'S TURN")
-            print(f"{'='*60}")
+            print(_SEP)
 
             # Check for ascension card unlocks based on level
             num_slots_needed = 0
@@ -3389,9 +3622,9 @@ def main():
             # Equip the deck after player is done prepping
             player.equip_deck(deck)
 
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("ALL PLAYERS READY")
-        print("="*60)
+        print(_SEP)
         print("All players have completed their preparation!")
 
         # Save option before entering tower
@@ -3399,9 +3632,9 @@ def main():
         if save_choice == 'y':
             save_game(players, "save_game.json")
 
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("ENTERING AUTO-BATTLE MODE")
-        print("="*60)
+        print(_SEP)
         print("\nAll players will now automatically enter the tower.")
         print("Battles will be simulated and results reported at the end.")
         print("\nSimulating battles...")
@@ -3409,7 +3642,7 @@ def main():
 
         # Tower climbing - AUTO-BATTLE MODE
         tower = Tower()
-        active_players = players.copy()
+        active_players = players
 
         while active_players:
             floor = active_players[0].current_floor + 1
@@ -3419,8 +3652,9 @@ def main():
                 player_status = ", ".join([f"{p.name} (Floor {p.current_floor})" for p in active_players])
                 print(f"  Floor {floor}: {player_status}")
 
-            # Each active player attempts this floor
-            for player in active_players[:]:  # Copy list to modify during iteration
+            # Each active player attempts this floor; winners carry on to the next one
+            survivors = []
+            for player in active_players:
                 player.current_floor = floor
 
                 # Generate enemies for this floor
@@ -3439,6 +3673,7 @@ def main():
                         print(f"  ⚡ {player.name} leveled up to {player.level}! (Next run: {player.get_max_packs()} packs)")
 
                     player.reset_for_floor()  # Heal for next floor
+                    survivors.append(player)
                 else:
                     # Player escaped
                     # Update highest floor if this is a new record
@@ -3449,9 +3684,10 @@ def main():
                         if bonus_increase > 0:
                             print(f"  🏆 New record! Floor {player.highest_floor} (+{bonus_increase} bonus pack(s) next run)")
 
-                    active_players.remove(player)
                     print(f"  ⚠️  {player.name} escaped at floor {player.current_floor}!")
 
+            active_players = survivors
+
             # Check if we've reached the top or all players are out
             if not active_players:
                 break
@@ -3469,17 +3705,17 @@ def main():
         print_battle_report(players)
 
         # Save game option
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("SAVE GAME")
-        print("="*60)
+        print(_SEP)
         save_choice = input("\nSave game progress? [y/n]: ").strip().lower()
         if save_choice == 'y':
             save_game(players, "save_game.json")
 
         # Prepare for next day - clear decks and increment day counter
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("DAY COMPLETE - Preparing for next day...")
-        print("="*60)
+        print(_SEP)
         for player in players:
             # Clear deck for new day
             player.deck = []